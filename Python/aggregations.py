@@ -0,0 +1,55 @@
+"""
+Grouped ratio-of-sums aggregation.
+
+League batting average by year is sum(h) / sum(ab) per year, not the mean of
+the team averages; KOVO reception efficiency is (sum(정확) - sum(실패)) /
+sum(시도) per season. `grouped_ratios` computes any number of such ratios with
+one native `groupby().agg()` over precomputed term columns, instead of calling
+a Python lambda per group. `ratio_of_sums` is the Polars expression version.
+
+A ratio term is a column name or a {column: weight} mapping for a weighted sum
+of columns, e.g. {'리시브_정확': 1, '리시브_실패': -1}.
+"""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+
+def _term_values(frame, term):
+    if isinstance(term, str):
+        return frame[term].to_numpy(dtype=np.float64)
+    return sum(weight * frame[column].to_numpy(dtype=np.float64)
+               for column, weight in term.items())
+
+
+def grouped_ratios(frame, by, **ratios):
+    """
+    One row per group with a column per ratio, as sum(numerator) / sum(denominator).
+
+    Each keyword is `name=(numerator, denominator)`. Groups are sorted, and
+    only groups that occur in `frame` are returned, also for categorical keys.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    terms = pd.DataFrame({column: frame[column] for column in by})
+    for name, (numerator, denominator) in ratios.items():
+        terms[f'{name}__num'] = _term_values(frame, numerator)
+        terms[f'{name}__den'] = _term_values(frame, denominator)
+    sums = terms.groupby(by, observed=True, sort=True).sum()
+    result = pd.DataFrame(index=sums.index)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for name in ratios:
+            result[name] = sums[f'{name}__num'] / sums[f'{name}__den']
+    return result.reset_index()
+
+
+def _term_expr(term):
+    if isinstance(term, str):
+        return pl.col(term).cast(pl.Float64)
+    return pl.sum_horizontal(weight * pl.col(column).cast(pl.Float64)
+                             for column, weight in term.items())
+
+
+def ratio_of_sums(numerator, denominator):
+    """Polars aggregation expression for sum(numerator) / sum(denominator)."""
+    return _term_expr(numerator).sum() / _term_expr(denominator).sum()
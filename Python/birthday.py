@@ -0,0 +1,65 @@
+"""
+Batched Monte Carlo simulation of the birthday paradox.
+
+Instead of building one DataFrame per repetition, every repetition is a row
+of a 2-D NumPy integer matrix. A whole sweep of group sizes is answered from a
+single matrix whose width is the largest group size: for each row we find the
+first position whose birthday already appeared earlier in the row, and a group
+of `n` people has a shared birthday exactly when that position is below `n`.
+Rows are drawn in chunks so the memory use is bounded by `max_cells`.
+"""
+
+import numpy as np
+import pandas as pd
+
+DAYS = 365
+MAX_CELLS = 2**22
+
+
+def first_collision(draws):
+    """Index of the first repeated value in each row (row width if none)."""
+    n_rows, width = draws.shape
+    if width < 2:
+        return np.full(n_rows, width)
+    # A stable sort keeps equal days in column order, so in every run of equal
+    # days all but the first element are repeats of an earlier column.
+    order = np.argsort(draws, axis=1, kind='stable')
+    ordered = np.take_along_axis(draws, order, axis=1)
+    repeated = ordered[:, 1:] == ordered[:, :-1]
+    positions = np.where(repeated, order[:, 1:], width)
+    return positions.min(axis=1)
+
+
+def simulate_birthday_sweep(reps, sizes, days=DAYS, rng=None, max_cells=MAX_CELLS):
+    """
+    Share of `reps` simulated groups with a shared birthday, for every size in `sizes`.
+
+    All sizes are estimated from the same draws (the first `n` columns form the
+    group of `n` people), so the curve is smooth and each point is unbiased.
+    Returns a DataFrame with the columns '사람' and '결과'.
+    """
+    rng = np.random.default_rng(rng)
+    sizes = np.asarray(list(sizes), dtype=np.int64)
+    # With more than `days` people a repeat is certain, so wider rows add nothing.
+    width = int(min(sizes.max(initial=0), days + 1))
+    dtype = np.int16 if days <= np.iinfo(np.int16).max else np.int32
+
+    counts = np.zeros(width + 1, dtype=np.int64)
+    if width > 0:
+        chunk = max(1, max_cells // width)
+        for start in range(0, reps, chunk):
+            n_rows = min(chunk, reps - start)
+            draws = rng.integers(0, days, size=(n_rows, width), dtype=dtype)
+            counts += np.bincount(first_collision(draws), minlength=width + 1)
+
+    # P(shared birthday among n) = P(first collision index <= n - 1)
+    cumulative = np.cumsum(counts) / reps
+    lookup = np.clip(np.minimum(sizes, width) - 1, 0, None)
+    results = np.where(sizes >= 2, cumulative[lookup], 0.0)
+    return pd.DataFrame({'사람': sizes, '결과': results})
+
+
+def simulate_birthday_paradox(reps, size, days=DAYS, rng=None, max_cells=MAX_CELLS):
+    """Share of `reps` simulated groups of `size` people with a shared birthday."""
+    sweep = simulate_birthday_sweep(reps, [size], days=days, rng=rng, max_cells=max_cells)
+    return float(sweep['결과'].iloc[0])
@@ -0,0 +1,159 @@
+"""
+The book's shared figures, declared once for the figure registry.
+
+Each figure pairs a data query (through the cached loaders and the
+pre-aggregation helpers) with an Altair and a matplotlib renderer (plus
+plotnine where the chapter draws it with plotnine). Chapters 3 and 4 show these
+figures through `figures.chart`; their step-by-step variations stay inline. Run
+
+    python book_figures.py --backend altair --format html
+
+to (re)build the figure set; only figures whose data or spec changed are
+rendered again.
+"""
+
+import argparse
+
+import altair as alt
+import matplotlib.pyplot as plt
+import numpy as np
+from plotnine import aes, geom_line, ggplot
+
+import datasets
+from aggregations import grouped_ratios
+from density import location_density
+from figures import register, render_all
+from summaries import density, histogram
+
+PITCH_COLUMNS = ['pitch_name', 'stand', 'release_speed', 'plate_x', 'plate_z']
+
+
+# Histogram of AVG (chapter 3)
+def _avg_histogram_query():
+    return histogram(datasets.kbo_batting_qualified(columns=['avg']), 'avg', bins=30)
+
+
+def _avg_histogram_altair(bins):
+    return alt.Chart(bins).mark_bar(color='#53BFD4', stroke='white', strokeWidth=1).encode(
+        alt.X('bin_start:Q', bin='binned', title='avg'),
+        x2='bin_end',
+        y='count:Q',
+    ).properties(width=600, height=400, title='Histogram of AVG')
+
+
+def _avg_histogram_matplotlib(bins):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.bar(bins['bin_start'], bins['count'], width=bins['bin_end'] - bins['bin_start'],
+           align='edge', color='#53BFD4', edgecolor='white')
+    ax.set(xlabel='avg', ylabel='count', title='Histogram of AVG')
+    return fig
+
+
+register('avg_histogram', _avg_histogram_query,
+         altair=_avg_histogram_altair, matplotlib=_avg_histogram_matplotlib)
+
+
+# Pitch location density by pitch and batter stand (chapter 3)
+def _pitch_location_query():
+    return location_density(datasets.ryu_2020(columns=PITCH_COLUMNS))
+
+
+def _pitch_location_altair(grid):
+    return alt.Chart(grid).mark_rect().encode(
+        x=alt.X('x0:Q', title='plate_x'),
+        x2='x1',
+        y=alt.Y('y0:Q', title='plate_z'),
+        y2='y1',
+        color=alt.Color('density:Q', scale=alt.Scale(scheme='reds'), legend=None),
+    ).properties(width=200, height=200).facet(row='stand:N', column='pitch_name:N')
+
+
+def _pitch_location_matplotlib(grid):
+    pitches = list(grid['pitch_name'].unique())
+    stands = list(grid['stand'].unique())
+    fig, axes = plt.subplots(len(stands), len(pitches), squeeze=False,
+                             figsize=(3 * len(pitches), 3 * len(stands)),
+                             sharex=True, sharey=True)
+    for (stand, pitch), cells in grid.groupby(['stand', 'pitch_name'], observed=True):
+        ax = axes[stands.index(stand), pitches.index(pitch)]
+        matrix = cells.pivot(index='y', columns='x', values='density')
+        ax.contourf(matrix.columns, matrix.index, matrix.to_numpy(), levels=5, cmap='Reds')
+        ax.set_aspect('equal')
+        ax.set_title(f'{pitch} / {stand}', fontsize=9)
+    return fig
+
+
+register('pitch_location_density', _pitch_location_query,
+         altair=_pitch_location_altair, matplotlib=_pitch_location_matplotlib)
+
+
+# Release speed density by pitch (chapter 3)
+def _release_speed_query():
+    return density(datasets.ryu_2020(columns=PITCH_COLUMNS), 'release_speed',
+                   groupby='pitch_name')
+
+
+def _release_speed_altair(curves):
+    return alt.Chart(curves).mark_line(strokeWidth=2).encode(
+        x=alt.X('release_speed:Q', title='Release Speed'),
+        y=alt.Y('density:Q', title='Density'),
+        color='pitch_name:N',
+    ).properties(width=600, height=400, title='Density Plot of Release Speed')
+
+
+def _release_speed_matplotlib(curves):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for (pitch,), curve in curves.group_by('pitch_name', maintain_order=True):
+        ax.plot(curve['release_speed'], curve['density'], label=pitch)
+    ax.set(xlabel='Release Speed', ylabel='Density', title='Density Plot of Release Speed')
+    ax.legend()
+    return fig
+
+
+register('release_speed_density', _release_speed_query,
+         altair=_release_speed_altair, matplotlib=_release_speed_matplotlib)
+
+
+# League AVG by year (chapter 4)
+def _league_avg_query():
+    return grouped_ratios(datasets.kbo_team_batting(columns=['year', 'h', 'ab']),
+                          'year', avg=('h', 'ab'))
+
+
+def _league_avg_altair(avg_by_year):
+    return alt.Chart(avg_by_year).mark_line().encode(
+        x='year:Q',
+        y=alt.Y('avg:Q', scale=alt.Scale(zero=False)),
+    ).properties(width=600, height=400, title='League AVG by Year')
+
+
+def _league_avg_matplotlib(avg_by_year):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(avg_by_year['year'], avg_by_year['avg'])
+    ax.set(xlabel='year', ylabel='avg', title='League AVG by Year')
+    ax.set_xticks(np.arange(avg_by_year['year'].min(), avg_by_year['year'].max() + 1, 5))
+    return fig
+
+
+def _league_avg_plotnine(avg_by_year):
+    return ggplot(avg_by_year, aes(x='year', y='avg')) + geom_line()
+
+
+register('league_avg_by_year', _league_avg_query, altair=_league_avg_altair,
+         matplotlib=_league_avg_matplotlib, plotnine=_league_avg_plotnine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backend', default='altair', choices=['altair', 'matplotlib', 'plotnine'])
+    parser.add_argument('--format', default=None,
+                        help='output format (default: html for altair, png otherwise)')
+    parser.add_argument('--force', action='store_true', help='re-render even if cached')
+    args = parser.parse_args()
+    fmt = args.format or ('html' if args.backend == 'altair' else 'png')
+    for name, path in render_all(args.backend, fmt, force=args.force).items():
+        print(f'{name}: {path}')
+
+
+if __name__ == '__main__':
+    main()
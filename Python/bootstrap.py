@@ -0,0 +1,127 @@
+"""
+Vectorized bootstrap with percentile, standard-error and BCa intervals.
+
+All resample indices for a chunk of replicates are drawn as one integer matrix,
+and the statistic is evaluated along the last axis of the resampled matrix, so
+no per-replicate pandas objects are built. `data` is either one sample or a
+tuple of samples that are resampled independently (e.g. for a difference of
+means). A statistic is a name from STATISTICS or a function taking one array
+per sample, with observations along the last axis, and returning one value
+per row.
+"""
+
+import warnings
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+MAX_CELLS = 2**24
+
+STATISTICS = {
+    'mean': lambda x: x.mean(axis=-1),
+    'proportion': lambda x: x.mean(axis=-1),
+    'median': lambda x: np.median(x, axis=-1),
+    'diff_means': lambda x, y: x.mean(axis=-1) - y.mean(axis=-1),
+}
+
+BootstrapResult = namedtuple('BootstrapResult', ['estimate', 'replicates', 'ci'])
+
+
+def _samples(data):
+    if not isinstance(data, tuple):
+        data = (data,)
+    return tuple(np.asarray(sample, dtype=np.float64) for sample in data)
+
+
+def _statistic(statistic):
+    return STATISTICS[statistic] if isinstance(statistic, str) else statistic
+
+
+def _chunk_rows(samples, max_cells):
+    return max(1, max_cells // max(sum(len(sample) for sample in samples), 1))
+
+
+def bootstrap_replicates(data, statistic='mean', reps=1000, rng=None, max_cells=MAX_CELLS):
+    """Bootstrap distribution of `statistic` over `reps` resamples of `data`."""
+    rng = np.random.default_rng(rng)
+    samples = _samples(data)
+    func = _statistic(statistic)
+
+    replicates = np.empty(reps)
+    chunk = _chunk_rows(samples, max_cells)
+    for start in range(0, reps, chunk):
+        n_rows = min(chunk, reps - start)
+        resampled = [sample[rng.integers(0, len(sample), size=(n_rows, len(sample)))]
+                     for sample in samples]
+        replicates[start:start + n_rows] = func(*resampled)
+    return replicates
+
+
+def jackknife(data, statistic='mean', max_cells=MAX_CELLS):
+    """Leave-one-out values of `statistic`, one per observation across all samples."""
+    samples = _samples(data)
+    func = _statistic(statistic)
+    whole = [sample[None, :] for sample in samples]
+
+    values = []
+    for j, sample in enumerate(samples):
+        n = len(sample)
+        keep = np.arange(n - 1)
+        chunk = _chunk_rows(samples, max_cells)
+        for start in range(0, n, chunk):
+            dropped = np.arange(start, min(start + chunk, n))
+            # Row i holds every index except dropped[i]
+            left_out = sample[keep[None, :] + (keep[None, :] >= dropped[:, None])]
+            args = whole[:j] + [left_out] + whole[j + 1:]
+            values.append(np.broadcast_to(func(*args), len(dropped)))
+    return np.concatenate(values)
+
+
+def confidence_intervals(data, replicates, statistic='mean', level=0.95, max_cells=MAX_CELLS):
+    """Percentile, standard-error and BCa intervals as a DataFrame."""
+    samples = _samples(data)
+    func = _statistic(statistic)
+    estimate = float(func(*[sample[None, :] for sample in samples])[0])
+    replicates = np.asarray(replicates)
+    tail = (1 - level) / 2
+    z = ndtri(1 - tail)
+
+    percentile = np.quantile(replicates, [tail, 1 - tail])
+
+    se = replicates.std(ddof=1)
+
+    # Bias correction from the share of replicates below the estimate (ties
+    # count half) and acceleration from the jackknife skewness.
+    below = (replicates < estimate).mean() + 0.5 * (replicates == estimate).mean()
+    z0 = ndtri(below)
+    jack = jackknife(samples, func, max_cells)
+    deviations = jack.mean() - jack
+    denominator = 6 * (deviations ** 2).sum() ** 1.5
+    accel = (deviations ** 3).sum() / denominator if denominator > 0 else 0.0
+    z_tails = z0 + np.array([-z, z])
+    with np.errstate(invalid='ignore'):
+        levels = ndtr(z0 + z_tails / (1 - accel * z_tails))
+    if np.isfinite(levels).all():
+        bca = np.quantile(replicates, levels)
+    else:
+        # Every replicate on one side of the estimate makes z0 infinite
+        warnings.warn('BCa bias correction is infinite (all replicates on one side '
+                      'of the estimate); using the percentile interval', RuntimeWarning,
+                      stacklevel=2)
+        bca = percentile
+
+    return pd.DataFrame({
+        'method': ['percentile', 'se', 'bca'],
+        'estimate': estimate,
+        'lower': [percentile[0], estimate - z * se, bca[0]],
+        'upper': [percentile[1], estimate + z * se, bca[1]],
+    })
+
+
+def bootstrap(data, statistic='mean', reps=1000, level=0.95, rng=None, max_cells=MAX_CELLS):
+    """Bootstrap `statistic` and return the estimate, replicates and intervals."""
+    replicates = bootstrap_replicates(data, statistic, reps, rng, max_cells)
+    ci = confidence_intervals(data, replicates, statistic, level, max_cells)
+    return BootstrapResult(float(ci['estimate'].iloc[0]), replicates, ci)
@@ -0,0 +1,168 @@
+"""
+DuckDB catalog over the data files in R/.
+
+`connect()` opens a DuckDB database in which every file declared in
+datasets.SCHEMAS is a typed view named after its loader (`kbo_team_batting`,
+`fifa_ranking`, `nba_19_20`, ...). The views read the Parquet copies that
+datasets keeps in R/.parquet, so the dates and categoricals declared there
+carry over, the Excel sheet is parsed once, and DuckDB scans the files in
+parallel with projection and filter pushdown. With `materialize=True` the
+files are copied into tables of a local .duckdb file instead; a table is
+rebuilt only when its Parquet copy changes.
+
+The Parquet copies are named after the source file's mtime and size, so a
+view goes stale when its CSV is edited and the old copy is removed. `query`
+then re-registers the views against the current copies (`register`) and
+retries once, which keeps long-lived connections such as the dashboard's
+working.
+
+`query` runs SQL and returns a pyarrow Table, which converts to pandas or
+Polars without a copy for most types. The analyses below are the chapter
+aggregations written as SQL:
+
+    team_records(since='1993-08-08')   # chapter 6, W/D/L per team
+    league_avg_by_year()               # chapter 4, league AVG per year
+    venue_win_rates()                  # chapter 11, win rate per team and venue
+"""
+
+import duckdb
+
+import datasets
+
+DATABASE = datasets.CACHE_DIR / 'sports.duckdb'
+
+# view name -> file name in R/
+TABLES = {
+    'nba_19_20': '19_20_nba.csv',
+    'uefa_big_5_19_20': '19_20_uefa_big_5.csv',
+    'kbo_team_batting_2020': '2020_kbo_team_batting.csv',
+    'ryu_2020': '2020_ryu.csv',
+    'cheonan_attendance': 'cheonan_attendance.csv',
+    'fifa_ranking': 'fifa_ranking.csv',
+    'gocheock_attendance': 'gocheock_attendance.csv',
+    'international_soccer_matches_results': 'international_soccer_matches_results.csv',
+    'kbo_batting_bayesian': 'kbo_batting_bayesian.csv',
+    'kbo_batting_qualified': 'kbo_batting_qualified.csv',
+    'kbo_batting_risp': 'kbo_batting_risp.csv',
+    'kbo_players_profiles': 'kbo_players_profiles.csv',
+    'kbo_pythagorean_expectation': 'kbo_pythagorean_expectation.csv',
+    'kbo_team_batting': 'kbo_team_batting.csv',
+    'kbo_team_slash_untidy': 'kbo_team_slash_untidy.xlsx',
+    'kovo_set_by_set': 'kovo_set_by_set.csv',
+    'kovo_sets_results': 'kovo_sets_results.csv',
+    'kovo_team': 'kovo_team.csv',
+    'nba_draft_data': 'nba_draft_data.csv',
+    'tennis_big3_results': 'tennis_big3_results.csv',
+}
+
+_connection = None
+
+
+def _sql_string(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _materialize(con, table, source):
+    con.execute('CREATE TABLE IF NOT EXISTS _sources (name VARCHAR PRIMARY KEY, source VARCHAR)')
+    current = con.execute('SELECT source FROM _sources WHERE name = ?', [table]).fetchone()
+    if current is None or current[0] != source.name:
+        con.execute(f'CREATE OR REPLACE TABLE {table} AS '
+                    f'SELECT * FROM read_parquet({_sql_string(source)})')
+        con.execute('INSERT OR REPLACE INTO _sources VALUES (?, ?)', [table, source.name])
+
+
+def register(con, materialize=False):
+    """(Re)create the view or table of every data file from its current Parquet copy."""
+    for table, name in TABLES.items():
+        source = datasets.parquet_path(name)
+        if materialize:
+            _materialize(con, table, source)
+        else:
+            con.execute(f'CREATE OR REPLACE VIEW {table} AS '
+                        f'SELECT * FROM read_parquet({_sql_string(source)})')
+
+
+def connect(database=':memory:', materialize=False, threads=None):
+    """
+    DuckDB connection with one view (or, with `materialize`, one table) per
+    data file. Pass `database=DATABASE` to keep materialized tables between
+    processes.
+    """
+    con = duckdb.connect(str(database))
+    if threads is not None:
+        con.execute(f'SET threads = {int(threads)}')
+    register(con, materialize)
+    return con
+
+
+def connection():
+    """The shared in-memory catalog of this process, created on first use."""
+    global _connection
+    if _connection is None:
+        _connection = connect()
+    return _connection
+
+
+def query(sql, params=None, con=None):
+    """Run `sql` (with `?` placeholders bound to `params`) and return a pyarrow Table."""
+    con = connection() if con is None else con
+    try:
+        return con.execute(sql, params or []).fetch_arrow_table()
+    except duckdb.IOException:
+        # a view points at a Parquet copy replaced since it was registered
+        register(con)
+        return con.execute(sql, params or []).fetch_arrow_table()
+
+
+def team_records(since=None, until=None, tournaments=None, con=None):
+    """
+    Wins, draws, loses, matches and win_percent per team, from matches after
+    `since` and up to `until` (dates), optionally only in `tournaments`.
+    """
+    tournaments = list(tournaments) if tournaments is not None else None
+    return query("""
+        WITH matches AS (
+            SELECT * FROM international_soccer_matches_results
+            WHERE (?::DATE IS NULL OR date > ?::DATE)
+              AND (?::DATE IS NULL OR date <= ?::DATE)
+              AND (?::TEXT[] IS NULL OR list_contains(?::TEXT[], tournament::TEXT))
+        ),
+        sides AS (
+            SELECT home_team AS team, home_score AS team_score, away_score AS opponent_score
+            FROM matches
+            UNION ALL
+            SELECT away_team, away_score, home_score FROM matches
+        )
+        SELECT team,
+               count_if(team_score > opponent_score) AS wins,
+               count_if(team_score = opponent_score) AS draws,
+               count_if(team_score < opponent_score) AS loses,
+               count(*) AS matches,
+               wins / matches AS win_percent
+        FROM sides
+        WHERE team_score IS NOT NULL AND opponent_score IS NOT NULL
+        GROUP BY team
+        ORDER BY team
+    """, [since, since, until, until, tournaments, tournaments], con)
+
+
+def league_avg_by_year(con=None):
+    """League batting average (sum of h over sum of ab) per year."""
+    return query("""
+        SELECT year, sum(h) / sum(ab) AS avg
+        FROM kbo_team_batting
+        GROUP BY year
+        ORDER BY year
+    """, con=con)
+
+
+def venue_win_rates(by='장소', con=None):
+    """Win rate (mean of 승리) per team and `by` (장소 or 시기) in the UEFA big-5 season."""
+    if by not in ('장소', '시기'):
+        raise ValueError(f'by must be 장소 or 시기, not {by!r}')
+    return query(f"""
+        SELECT 팀, "{by}", avg(승리) AS 승률
+        FROM uefa_big_5_19_20
+        GROUP BY 팀, "{by}"
+        ORDER BY 팀, "{by}"
+    """, con=con)
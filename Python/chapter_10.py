@@ -25,6 +25,8 @@ It demonstrates bootstrapping to estimate confidence intervals using pandas and
 import pandas as pd
 import numpy as np
 from plotnine import ggplot, aes, geom_histogram, geom_vline, annotate
+from bootstrap import bootstrap
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -32,7 +34,7 @@ np.random.seed(1234)
 # %%
 # Load data
 try:
-    cheonan_attendance = pd.read_csv('cheonan_attendance.csv')
+    cheonan_attendance = datasets.cheonan_attendance()
 except FileNotFoundError:
     print("Could not find cheonan_attendance.csv.")
     cheonan_attendance = pd.DataFrame()
@@ -63,15 +65,11 @@ if not cheonan_attendance.empty:
     # A more standard workflow would be to bootstrap from the original sample of 20 people.
     # However, we will follow the R script's logic.
 
+    # All resamples are drawn as one index matrix (see bootstrap.py)
     n_reps = 1000
-    bootstrap_means = []
-    for _ in range(n_reps):
-        # Generate a bootstrap sample by resampling from the sample of proportions
-        bootstrap_sample = cheonan_sample['여성비율'].sample(frac=1, replace=True)
-        # Calculate the mean of the bootstrap sample
-        bootstrap_means.append(bootstrap_sample.mean())
-
-    cheonan_bootstrap = pd.DataFrame({'stat': bootstrap_means})
+    cheonan_result = bootstrap(cheonan_sample['여성비율'], statistic='mean', reps=n_reps, rng=1234)
+    cheonan_bootstrap = pd.DataFrame({'stat': cheonan_result.replicates})
+    print(cheonan_result.ci)
 
     # 3. Visualize the bootstrap distribution
     p = (ggplot(cheonan_bootstrap, aes(x='stat')) +
@@ -79,9 +77,9 @@ if not cheonan_attendance.empty:
     p
 
     # 4. Calculate the percentile confidence interval
-    ci_endpoints = cheonan_bootstrap['stat'].quantile([0.025, 0.975]).to_dict()
-    low = ci_endpoints[0.025]
-    high = ci_endpoints[0.975]
+    cheonan_ci = cheonan_result.ci.set_index('method')
+    low = cheonan_ci.loc['percentile', 'lower']
+    high = cheonan_ci.loc['percentile', 'upper']
     print(f"95% Percentile Confidence Interval: ({low:.3f}, {high:.3f})")
     
     # 5. Visualize the confidence interval
@@ -91,16 +89,19 @@ if not cheonan_attendance.empty:
     p
 
     # 6. Calculate confidence interval using the standard error method
-    point_estimate = cheonan_sample['여성비율'].mean()
-    se = cheonan_bootstrap['stat'].std()
-    ci_se_low = point_estimate - 1.96 * se
-    ci_se_high = point_estimate + 1.96 * se
+    ci_se_low = cheonan_ci.loc['se', 'lower']
+    ci_se_high = cheonan_ci.loc['se', 'upper']
     print(f"95% SE Confidence Interval: ({ci_se_low:.3f}, {ci_se_high:.3f})")
     
     p = (p +
          geom_vline(xintercept=[ci_se_low, ci_se_high], color='darkorange', linetype='dashed', size=1))
     p
 
+    # 7. Bias-corrected and accelerated (BCa) confidence interval
+    ci_bca_low = cheonan_ci.loc['bca', 'lower']
+    ci_bca_high = cheonan_ci.loc['bca', 'upper']
+    print(f"95% BCa Confidence Interval: ({ci_bca_low:.3f}, {ci_bca_high:.3f})")
+
 
 # %%
 print("Conversion of chapter_10.R to Python is complete.")
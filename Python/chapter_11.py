@@ -26,6 +26,8 @@ import pandas as pd
 import numpy as np
 from plotnine import ggplot, aes, geom_boxplot, geom_histogram, geom_vline, annotate
 from scipy.stats import ttest_ind
+from permutation import permutation_null, p_value
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -33,7 +35,7 @@ np.random.seed(1234)
 # %%
 # Load data
 try:
-    uefa_big5_match_results = pd.read_csv('19_20_uefa_big_5.csv')
+    uefa_big5_match_results = datasets.uefa_big_5_19_20()
 except FileNotFoundError:
     print("Could not find 19_20_uefa_big_5.csv.")
     uefa_big5_match_results = pd.DataFrame()
@@ -56,18 +58,10 @@ if not uefa_big5_match_results.empty:
     print(f"Observed difference in mean win rate (Home - Away): {obs_diff:.3f}")
 
     # Permutation Test
+    # All permutations are drawn as one label matrix (see permutation.py)
     n_reps = 1000
-    null_diffs = []
-    for _ in range(n_reps):
-        # Permute the '장소' labels
-        permuted_labels = np.random.permutation(uefa_big5_results['장소'])
-        permuted_df = uefa_big5_results.copy()
-        permuted_df['장소'] = permuted_labels
-        
-        # Calculate the difference in means for the permuted data
-        permuted_means = permuted_df.groupby('장소')['승률'].mean()
-        null_diffs.append(permuted_means['안방'] - permuted_means['방문'])
-
+    null_diffs = permutation_null(uefa_big5_results['승률'], uefa_big5_results['장소'],
+                                  reps=n_reps, groups=('안방', '방문'), rng=1234)
     uefa_big5_results_null = pd.DataFrame({'stat': null_diffs})
 
     # Visualize the null distribution
@@ -81,11 +75,11 @@ if not uefa_big5_match_results.empty:
 
     # Calculate p-value
     # For 'greater' direction as the observed diff is positive
-    p_value = (uefa_big5_results_null['stat'] >= obs_diff).mean()
-    print(f"P-value (one-sided, greater): {p_value}")
+    p_value_greater = p_value(null_diffs, obs_diff, alternative='greater')
+    print(f"P-value (one-sided, greater): {p_value_greater}")
 
     # For two-sided test
-    p_value_two_sided = (np.abs(uefa_big5_results_null['stat']) >= np.abs(obs_diff)).mean()
+    p_value_two_sided = p_value(null_diffs, obs_diff, alternative='two-sided')
     print(f"P-value (two-sided): {p_value_two_sided}")
 
     # Shade p-value area
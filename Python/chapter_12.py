@@ -27,6 +27,9 @@ import numpy as np
 from plotnine import ggplot, aes, geom_boxplot, geom_histogram, geom_vline, facet_grid, geom_density
 from scipy.stats import ttest_ind, ttest_1samp, t
 from statsmodels.stats.power import ttest_power
+from permutation import permutation_null
+from bootstrap import bootstrap_replicates
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -34,7 +37,7 @@ np.random.seed(1234)
 # %%
 # Load and prepare data
 try:
-    uefa_big5_match_results = pd.read_csv('19_20_uefa_big_5.csv')
+    uefa_big5_match_results = datasets.uefa_big_5_19_20()
 except FileNotFoundError:
     print("Could not find 19_20_uefa_big_5.csv.")
     uefa_big5_match_results = pd.DataFrame()
@@ -94,7 +97,7 @@ if not uefa_big5_match_results.empty:
     
     # Simulating H0 and H1 distributions for NBA data
     try:
-        nba_match_results = pd.read_csv('19_20_nba.csv')
+        nba_match_results = datasets.nba_19_20()
     except FileNotFoundError:
         print("Could not find '19_20_nba.csv'. Skipping H0/H1 simulation.")
         nba_match_results = pd.DataFrame()
@@ -107,25 +110,15 @@ if not uefa_big5_match_results.empty:
         nba_bc_summary = nba_bc_summary.rename(columns={'승리':'승률'})
 
         # H0 simulation (permutation)
-        h0_diffs = []
-        for _ in range(1000):
-            permuted_labels = np.random.permutation(nba_bc_summary['장소'])
-            permuted_df = nba_bc_summary.copy()
-            permuted_df['장소'] = permuted_labels
-            permuted_means = permuted_df.groupby('장소')['승률'].mean()
-            h0_diffs.append(permuted_means['안방'] - permuted_means['방문'])
-
+        h0_diffs = permutation_null(nba_bc_summary['승률'], nba_bc_summary['장소'],
+                                    reps=1000, groups=('안방', '방문'), rng=1234)
         nba_simulation_h0 = pd.DataFrame({'stat': h0_diffs, 'type': 'h0'})
 
         # H1 simulation (bootstrap)
         nba_bc_wide = nba_bc_summary.pivot(index='팀', columns='장소', values='승률').reset_index().dropna()
         nba_bc_wide['차이'] = nba_bc_wide['안방'] - nba_bc_wide['방문']
         
-        h1_means = []
-        for _ in range(1000):
-            bootstrap_sample = nba_bc_wide['차이'].sample(frac=1, replace=True)
-            h1_means.append(bootstrap_sample.mean())
-        
+        h1_means = bootstrap_replicates(nba_bc_wide['차이'], statistic='mean', reps=1000, rng=1234)
         nba_simulation_h1 = pd.DataFrame({'stat': h1_means, 'type': 'h1'})
 
         # Combine and plot
@@ -143,5 +136,4 @@ if not uefa_big5_match_results.empty:
         # print(p)
 
 # %%
-print("
-Conversion of chapter_12.R to Python is complete.")
+print("\nConversion of chapter_12.R to Python is complete.")
@@ -28,6 +28,7 @@ from plotnine import ggplot, aes, geom_histogram, geom_density, geom_boxplot, ge
 from scipy.stats import f, f_oneway
 import statsmodels.api as sm
 from statsmodels.formula.api import ols
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -86,7 +87,7 @@ print(f"Manual F-statistic: {F_stat_manual:.2f}")
 # %%
 # --- ANOVA on NBA Draft Data ---
 try:
-    nba_players = pd.read_csv('nba_draft_data.csv', encoding="iso-8859-1")
+    nba_players = datasets.nba_draft_data()
 except FileNotFoundError:
     print("Could not find nba_draft_data.csv.")
     nba_players = pd.DataFrame()
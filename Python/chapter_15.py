@@ -28,6 +28,8 @@ from plotnine import ggplot, aes, geom_point, geom_smooth, geom_hline, geom_qq,
 from scipy.stats import pearsonr, shapiro
 import statsmodels.api as sm
 from statsmodels.formula.api import ols
+from sabermetrics import rate_stats
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -35,7 +37,7 @@ np.random.seed(1234)
 # %%
 # --- Correlation ---
 try:
-    batting_2020 = pd.read_csv('2020_kbo_team_batting.csv')
+    batting_2020 = datasets.kbo_team_batting_2020()
 except FileNotFoundError:
     print("Could not find 2020_kbo_team_batting.csv.")
     batting_2020 = pd.DataFrame()
@@ -105,7 +107,7 @@ if not batting_2020.empty:
 # %%
 # --- Application: Finding best predictor for runs ---
 try:
-    team_batting = pd.read_csv('kbo_team_batting.csv')
+    team_batting = datasets.kbo_team_batting()
 except FileNotFoundError:
     print("Could not find 'kbo_team_batting.csv'.")
     team_batting = pd.DataFrame()
@@ -116,12 +118,8 @@ team_batting
 # %%
 if not team_batting.empty:
     # Feature engineering
-    team_batting = team_batting.assign(
-        runs_per_tpa = lambda df: df['r'] / df['tpa'],
-        obp = lambda df: (df['h'] + df['bb'] + df['hbp']) / (df['ab'] + df['bb'] + df['hbp'] + df['sf']),
-        slg = lambda df: (df['h'] + 2*df['2b'] + 3*df['3b'] + 4*df['hr']) / df['ab']
-    )
-    team_batting['ops'] = team_batting['obp'] + team_batting['slg']
+    team_batting = rate_stats(team_batting, stats=['obp', 'slg', 'ops'])
+    team_batting['runs_per_tpa'] = team_batting['r'] / team_batting['tpa']
 
     predictors = ['obp', 'slg', 'ops']  # 'avg', 
     results = []
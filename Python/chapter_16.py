@@ -31,6 +31,8 @@ from statsmodels.stats.outliers_influence import variance_inflation_factor
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error
+from sabermetrics import rate_stats
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -38,19 +40,15 @@ np.random.seed(1234)
 # %%
 # Load and prepare data
 try:
-    team_batting = pd.read_csv('kbo_team_batting.csv')
+    team_batting = datasets.kbo_team_batting()
 except FileNotFoundError:
     print("Could not find 'kbo_team_batting.csv'.")
     team_batting = pd.DataFrame()
 
 # %%
 if not team_batting.empty:
-    team_batting = team_batting.assign(
-        runs = lambda df: df['r'] / df['tpa'],
-        avg = lambda df: df['h'] / df['ab'],
-        obp = lambda df: (df['h'] + df['bb'] + df['hbp']) / (df['ab'] + df['bb'] + df['hbp'] + df['sf']),
-        slg = lambda df: (df['h'] + 2*df['2b'] + 3*df['3b'] + 4*df['hr']) / df['ab']
-    )
+    team_batting = rate_stats(team_batting, stats=['avg', 'obp', 'slg'])
+    team_batting['runs'] = team_batting['r'] / team_batting['tpa']
 
     # --- Multicollinearity (VIF) ---
     # Select predictors
@@ -101,7 +99,7 @@ if not team_batting.empty:
 # %%
 # --- Interaction Terms ---
 try:
-    kovo_sets_results = pd.read_csv('kovo_sets_results.csv')
+    kovo_sets_results = datasets.kovo_sets_results()
 except FileNotFoundError:
     print("Could not find 'kovo_sets_results.csv'.")
     kovo_sets_results = pd.DataFrame()
@@ -33,6 +33,7 @@ from sklearn.pipeline import Pipeline
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, confusion_matrix, roc_curve, roc_auc_score
 import matplotlib.pyplot as plt # For ROC curve plotting helper
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -78,7 +79,7 @@ p_sigmoid = (ggplot(sigmoid_df, aes(x='x', y='y')) + geom_line())
 # %%
 # --- Logistic Regression ---
 try:
-    kovo_sets = pd.read_csv('kovo_set_by_set.csv')
+    kovo_sets = datasets.kovo_set_by_set()
     kovo_sets['승리'] = kovo_sets['승리'].astype('category') # Target variable
 except FileNotFoundError:
     print("Could not find 'kovo_set_by_set.csv'.")
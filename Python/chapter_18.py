@@ -24,9 +24,12 @@ It covers probability simulations (Monty Hall problem) and Bayesian statistics.
 # %%
 import pandas as pd
 import numpy as np
-from plotnine import ggplot, aes, geom_line, geom_histogram, geom_hline, stat_function
+from plotnine import ggplot, aes, geom_line, geom_histogram, geom_hline, stat_function, scale_y_continuous
 from scipy.stats import beta
 from scipy.optimize import fmin_tnc # for fitting beta distribution if beta.fit is not enough
+from monty_hall import simulate_monty_hall, stream_success_rate
+from shrinkage import fit_beta_prior, posterior, shrink
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -36,49 +39,9 @@ np.random.seed(1234)
 n_trials = 10000
 
 # %%
-# Simulate car position and initial pick
-cars = np.random.randint(1, 4, n_trials)
-initial_picks = np.random.randint(1, 4, n_trials)
-
-# %%
-# Determine what Monty opens (must not be car, must not be initial pick)
-monty_opens = np.zeros(n_trials, dtype=int)
-for i in range(n_trials):
-    available_doors = [1, 2, 3]
-    
-    # Remove the car door and the initial pick from options for Monty to open
-    # If initial pick is car, Monty can open any of the other two
-    if cars[i] == initial_picks[i]:
-        options_for_monty = [d for d in available_doors if d != cars[i]]
-    else:
-        # If initial pick is not car, Monty must open the remaining empty door
-        options_for_monty = [d for d in available_doors if d != cars[i] and d != initial_picks[i]]
-    
-    monty_opens[i] = np.random.choice(options_for_monty)
-
-
-# %%
-# Determine the door if we switch
-switched_picks = np.zeros(n_trials, dtype=int)
-for i in range(n_trials):
-    available_doors = [1, 2, 3]
-    options_to_switch_to = [d for d in available_doors if d != initial_picks[i] and d != monty_opens[i]]
-    switched_picks[i] = options_to_switch_to[0] # There will only be one option
-
-
-# %%
-# Calculate results
-results_df = pd.DataFrame({
-    'trial': np.arange(1, n_trials + 1),
-    'car': cars,
-    'initial_pick': initial_picks,
-    'monty_opens': monty_opens,
-    'switched_pick': switched_picks
-})
-
-# %%
-results_df['result_if_switch'] = (results_df['car'] == results_df['switched_pick']).astype(int)
-results_df['success_rate'] = results_df['result_if_switch'].expanding().mean()
+# Simulate car position, initial pick, Monty's door and the switched door
+# with array arithmetic (see monty_hall.py)
+results_df = simulate_monty_hall(n_trials, rng=1234)
 
 # %%
 # Plot simulation results
@@ -88,10 +51,18 @@ p = (ggplot(results_df, aes(x='trial', y='success_rate')) +
      scale_y_continuous(limits=(0, 1)))
 # print(p)
 
+# %%
+# Convergence over many more trials, streamed in chunks and thinned for plotting
+convergence_df = pd.concat(stream_success_rate(10_000_000, rng=1234, every=10_000), ignore_index=True)
+p = (ggplot(convergence_df, aes(x='trial', y='success_rate')) +
+     geom_line(size=1.25) +
+     geom_hline(yintercept=2/3, linetype='dashed', color='#147893', size=1))
+# print(p)
+
 # %%
 # --- Bayesian Batting Average Estimation ---
 try:
-    kbo_batting_bayesian = pd.read_csv('kbo_batting_bayesian.csv')
+    kbo_batting_bayesian = datasets.kbo_batting_bayesian()
 except FileNotFoundError:
     print("Could not find 'kbo_batting_bayesian.csv'.")
     kbo_batting_bayesian = pd.DataFrame()
@@ -106,9 +77,10 @@ if not kbo_batting_bayesian.empty:
               geom_histogram(aes(y='stat(density)'), fill='gray80', color='white', bins=30))
     # print(p_hist)
 
-    # Fit Beta distribution to batting averages
-    # beta.fit returns (alpha, beta, loc, scale). We want alpha and beta.
-    alpha_fit, beta_fit, _, _ = beta.fit(kbo_batting_250['avg'], floc=0, fscale=1)
+    # Fit Beta distribution to batting averages: method of moments refined
+    # to the MLE by Newton steps (see shrinkage.py), the same fit as
+    # beta.fit(..., floc=0, fscale=1) without a generic optimizer
+    alpha_fit, beta_fit = fit_beta_prior(kbo_batting_250['avg'])
     
     print(f"Fitted Beta Distribution Parameters: alpha={alpha_fit:.2f}, beta={beta_fit:.2f}")
 
@@ -135,6 +107,13 @@ if not kbo_batting_bayesian.empty:
     print(f"Player with {player_h} hits in {player_ab} at-bats:")
     print(f"Observed average: {player_h / player_ab:.3f}")
     print(f"Posterior mean batting average: {posterior_mean:.3f}")
+    _, low, high = posterior(player_h, player_ab, alpha_fit, beta_fit)
+    print(f"95% credible interval: ({float(low):.3f}, {float(high):.3f})")
+
+    # Every player-season at once, with one prior per year
+    kbo_batting_eb = shrink(kbo_batting_bayesian, by='year')
+    print(kbo_batting_eb.sort_values('eb_avg', ascending=False)
+          [['name', 'year', 'ab', 'h', 'avg', 'eb_avg', 'eb_low', 'eb_high']].head(10))
 
 # %%
 print("Conversion of chapter_18.R to Python is complete.")
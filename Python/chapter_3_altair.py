@@ -18,19 +18,26 @@ import polars as pl
 import numpy as np
 import altair as alt
 from scipy.stats import norm # For the geom_function equivalent
+import datasets
+from density import location_density
+from summaries import histogram, value_counts, density, box_stats, box_outliers
+import figures
+import book_figures  # noqa: F401  (registers the figures)
 
 # %%
 # --- Data Loading
-batting = pl.read_csv("kbo_batting_qualified.csv")
-ryu = pl.read_csv("2020_ryu.csv")
+batting = pl.read_parquet(datasets.parquet_path("kbo_batting_qualified.csv"))
+ryu = pl.read_parquet(datasets.parquet_path("2020_ryu.csv"),
+                      columns=["pitch_name", "stand", "release_speed", "plate_x", "plate_z"])
 
 # %% [markdown]
 # ## Histogram Chart
 
 # %%
-alt.Chart(batting).mark_bar().encode(
-    alt.X("avg:Q", bin=alt.Bin(maxbins=40)),
-    y='count()',
+alt.Chart(histogram(batting, "avg", bins=40)).mark_bar().encode(
+    alt.X("bin_start:Q", bin="binned", title="avg"),
+    x2="bin_end",
+    y="count:Q",
 ).properties(
     width=600,
     height=400,
@@ -38,9 +45,10 @@ alt.Chart(batting).mark_bar().encode(
 )
 
 # %%
-alt.Chart(batting).mark_bar().encode(
-    alt.X("avg:Q", bin=alt.Bin(step=0.001)),
-    y='count()',
+alt.Chart(histogram(batting, "avg", step=0.001)).mark_bar().encode(
+    alt.X("bin_start:Q", bin="binned", title="avg"),
+    x2="bin_end",
+    y="count:Q",
 ).properties(
     width=600,
     height=400,
@@ -48,13 +56,14 @@ alt.Chart(batting).mark_bar().encode(
 )
 
 # %%
-alt.Chart(batting).mark_bar(
+alt.Chart(histogram(batting, "avg", bins=30)).mark_bar(
     color="gray",
     stroke="red",
     strokeWidth=1,    
 ).encode(
-    alt.X("avg:Q", bin=alt.Bin(maxbins=30)),
-    y='count()',
+    alt.X("bin_start:Q", bin="binned", title="avg"),
+    x2="bin_end",
+    y="count:Q",
 ).properties(
     width=600,
     height=400,
@@ -62,13 +71,14 @@ alt.Chart(batting).mark_bar(
 )
 
 # %%
-alt.Chart(batting).mark_bar(
+alt.Chart(histogram(batting, "avg", bins=30)).mark_bar(
     color="blue",
     stroke="white",
     strokeWidth=1,    
 ).encode(
-    alt.X("avg:Q", bin=alt.Bin(maxbins=30)),
-    y='count()',
+    alt.X("bin_start:Q", bin="binned", title="avg"),
+    x2="bin_end",
+    y="count:Q",
 ).properties(
     width=600,
     height=400,
@@ -76,26 +86,16 @@ alt.Chart(batting).mark_bar(
 )
 
 # %%
-alt.Chart(batting).mark_bar(
-    color="#53BFD4",
-    stroke="white",
-    strokeWidth=1,    
-).encode(
-    alt.X("avg:Q", bin=alt.Bin(maxbins=30)),
-    y='count()',
-).properties(
-    width=600,
-    height=400,
-    title = "Histogram of AVG (Bins=30, Hex fill, White edge)",
-)
+# The book's version of this histogram comes from the figure registry (see book_figures.py)
+figures.chart("avg_histogram")
 
 # %% [markdown]
 # ## Bar Chart
 
 # %%
-alt.Chart(batting).mark_bar(size=80).encode(
+alt.Chart(value_counts(batting, "throw_bat")).mark_bar(size=80).encode(
     x=alt.X("throw_bat:N", sort='-y'),
-    y='count()',
+    y='count:Q',
 ).properties(
     width=600,
     height=400,
@@ -211,11 +211,8 @@ base = alt.Chart(ryu).encode(
 )
 
 # --- Violin ---
-violin = base.transform_density(
-    density="release_speed",
-    as_=["release_speed", "density"],
-    groupby=["pitch_name"],
-).mark_area(
+# KDE per pitch computed in Polars; only the grid goes into the spec
+violin = alt.Chart(density(ryu, "release_speed", groupby="pitch_name")).mark_area(
     orient="horizontal",
     opacity=0.4,
 ).encode(
@@ -240,12 +237,22 @@ jitter = base.transform_calculate(
 violin + jitter
 
 # %%
-alt.Chart(ryu).mark_boxplot(
-     size=150,   # ← increase this (default is usually ~20)
-).encode(
+# Box plot drawn from pre-computed quartiles, whiskers and outliers
+release_box = box_stats(ryu, "release_speed", "pitch_name")
+box_base = alt.Chart(release_box).encode(x="pitch_name:N")
+
+whiskers = box_base.mark_rule().encode(
+    y=alt.Y("lower:Q", title="release_speed", scale=alt.Scale(zero=False)),
+    y2="upper",
+)
+boxes = box_base.mark_bar(size=150).encode(y="q1:Q", y2="q3")
+medians = box_base.mark_tick(size=150, color="white").encode(y="median:Q")
+outliers = alt.Chart(box_outliers(ryu, "release_speed", "pitch_name", release_box)).mark_point().encode(
     x="pitch_name:N",
-    y=alt.Y("release_speed:Q", scale=alt.Scale(zero=False))
-).properties(
+    y="release_speed:Q",
+)
+
+(whiskers + boxes + medians + outliers).properties(
     width=600,
     height=400,
     title = "Box Plot of Release Speed vs Pitch Name",
@@ -294,19 +301,17 @@ alt.Chart(ryu).mark_circle(
 )
 
 # %%
-base = alt.Chart(ryu).mark_rect().encode(
-    x=alt.X(
-        "plate_x:Q",
-        bin=alt.Bin(maxbins=30),
-        title="plate_x",
-    ),
-    y=alt.Y(
-        "plate_z:Q",
-        bin=alt.Bin(maxbins=30),
-        title="plate_z",
-    ),
+# Binned on a 30 x 30 grid per facet before charting (see density.py)
+location_grid = location_density(ryu, bins=30)
+
+# %%
+base = alt.Chart(location_grid).mark_rect().encode(
+    x=alt.X("x0:Q", title="plate_x"),
+    x2="x1",
+    y=alt.Y("y0:Q", title="plate_z"),
+    y2="y1",
     color=alt.Color(
-        "count():Q",
+        "count:Q",
         scale=alt.Scale(scheme="reds"),
     )
 ).properties(
@@ -324,22 +329,18 @@ chart
 
 # %%
 # Conditional plot for 4-Seam Fastball and Changeup
-ryu_filtered = ryu.filter(pl.col("pitch_name").is_in(["4-Seam Fastball", "Changeup"]))
-
-# %%
-base = alt.Chart(ryu_filtered).mark_rect().encode(
-    x=alt.X(
-        "plate_x:Q",
-        bin=alt.Bin(maxbins=30),
-        title="plate_x",
-    ),
-    y=alt.Y(
-        "plate_z:Q",
-        bin=alt.Bin(maxbins=30),
-        title="plate_z",
-    ),
+location_grid_filtered = location_density(
+    ryu, bins=30, where={"pitch_name": ["4-Seam Fastball", "Changeup"]}
+)
+
+# %%
+base = alt.Chart(location_grid_filtered).mark_rect().encode(
+    x=alt.X("x0:Q", title="plate_x"),
+    x2="x1",
+    y=alt.Y("y0:Q", title="plate_z"),
+    y2="y1",
     color=alt.Color(
-        "count():Q",
+        "count:Q",
         scale=alt.Scale(scheme="reds"),
     )
 ).properties(
@@ -370,10 +371,7 @@ chart
 
 # %%
 # 🔹 Total density
-total = alt.Chart(ryu).transform_density(
-    "release_speed",
-    as_=["release_speed", "density"]
-).mark_line(
+total = alt.Chart(density(ryu, "release_speed")).mark_line(
     color="black",
     strokeWidth=3
 ).encode(
@@ -386,11 +384,7 @@ total = alt.Chart(ryu).transform_density(
 )
 
 # 🔹 Density by pitch type
-by_pitch = alt.Chart(ryu).transform_density(
-    "release_speed",
-    as_=["release_speed", "density"],
-    groupby=["pitch_name"]  # 👈 THIS IS THE KEY
-).mark_line(
+by_pitch = alt.Chart(density(ryu, "release_speed", groupby="pitch_name")).mark_line(
     color="gray",
     strokeWidth=2
 ).encode(
@@ -19,11 +19,15 @@ import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
 from scipy.stats import norm # For the geom_function equivalent
+import datasets
+from density import location_density
+import figures
+import book_figures  # noqa: F401  (registers the figures)
 
 # %%
 # --- Data Loading
-batting = pd.read_csv("kbo_batting_qualified.csv")
-ryu = pd.read_csv("2020_ryu.csv")
+batting = datasets.kbo_batting_qualified()
+ryu = datasets.ryu_2020(columns=["pitch_name", "stand", "release_speed", "plate_x", "plate_z"])
 
 # %% [markdown]
 # ## Histogram Chart
@@ -55,9 +59,8 @@ plt.title("Histogram of AVG (Bins=30, Blue fill, White edge)")
 plt.show()
 
 # %%
-plt.figure(figsize=(8, 5))
-sns.histplot(data=batting, x="avg", bins=30, edgecolor="white", facecolor="#53BFD4")
-plt.title("Histogram of AVG (Bins=30, Hex fill, White edge)")
+# The book's version of this histogram comes from the figure registry (see book_figures.py)
+figures.chart("avg_histogram", "matplotlib")
 plt.show()
 
 # %% [markdown]
@@ -197,21 +200,25 @@ plt.suptitle("Scatter Plot with Facet Grid (Pitch Name)", y=1.02)
 plt.show()
 
 # %%
-# Seaborn uses `kdeplot` for 2D density; FacetGrid is for faceting.
-g = sns.FacetGrid(ryu, col="pitch_name", row="stand", height=4, aspect=1)
-g.map(sns.kdeplot, "plate_x", "plate_z", fill=True, levels=5, cmap="Reds")
-g.set_titles(col_template="{col_name}", row_template="{row_name}")
+# 2D density grids are computed once per facet (see density.py) and drawn
+# as filled contours, instead of a KDE over the raw rows in every panel.
+def plot_density_grid(data, **kwargs):
+    grid = data.pivot(index="y", columns="x", values="density")
+    plt.contourf(grid.columns, grid.index, grid.to_numpy(), levels=5, cmap="Reds")
+
+# All pitches by stand is the registered figure; it draws the same contours
+figures.chart("pitch_location_density", "matplotlib")
 plt.suptitle("2D Density Plot with Facet Grid", y=1.02)
 plt.show()
 
 # %%
 # Conditional plot for 4-Seam Fastball and Changeup
-ryu_filtered = ryu[ryu["pitch_name"].isin(["4-Seam Fastball", "Changeup"])]
+location_grid_filtered = location_density(ryu, where={"pitch_name": ["4-Seam Fastball", "Changeup"]})
 
 # %%
 # (p + geom_density2df() + geom_rect(...) + facet_grid(x="stand", y="pitch_name") + coord_fixed() + guides(fill="none"))
-g = sns.FacetGrid(ryu_filtered, col="stand", row="pitch_name", height=4, aspect=1)
-g.map(sns.kdeplot, "plate_x", "plate_z", fill=True, levels=5, cmap="Reds")
+g = sns.FacetGrid(location_grid_filtered, col="stand", row="pitch_name", height=4, aspect=1)
+g.map_dataframe(plot_density_grid)
 g.set_titles(col_template="{col_name}", row_template="{row_name}")
 
 # %%
@@ -18,6 +18,8 @@
 import polars as pl
 from lets_plot import *
 from pyprojroot.here import here
+import datasets
+from density import location_density
 
 # %%
 # Path
@@ -31,7 +33,7 @@ LetsPlot.setup_html()
 # ## Histogram
 
 # %%
-batting = pl.read_csv("kbo_batting_qualified.csv")
+batting = pl.read_parquet(datasets.parquet_path("kbo_batting_qualified.csv"))
 
 # %%
 ggplot(data=batting)
@@ -116,7 +118,7 @@ p + geom_line(linetype=2)
 # ## Point
 
 # %%
-ryu = pl.read_csv("2020_ryu.csv")
+ryu = pl.read_parquet(datasets.parquet_path("2020_ryu.csv"))
 ryu.shape
 
 # %%
@@ -152,10 +154,14 @@ p + geom_point()
 # %%
 p + geom_point() + facet_grid(x="pitch_name") + coord_fixed()
 
+# %%
+# 2-D density grids per facet, computed once (see density.py)
+location_grid = location_density(ryu)
+
 # %%
 (
-    p
-    + geom_density2df()
+    ggplot(location_grid, aes(x="x", y="y", fill="density"))
+    + geom_tile()
     + facet_grid(x="pitch_name", y="stand")
     + coord_fixed()
     + guides(fill="none")
@@ -163,14 +169,14 @@ p + geom_point() + facet_grid(x="pitch_name") + coord_fixed()
 
 # %%
 p = ggplot(
-    ryu.filter(pl.col("pitch_name").is_in(["4-Seam Fastball", "Changeup"])),
-    aes(x="plate_x", y="plate_z"),
+    location_density(ryu, where={"pitch_name": ["4-Seam Fastball", "Changeup"]}),
+    aes(x="x", y="y", fill="density"),
 )
 
 # %%
 (
     p
-    + geom_density2df()
+    + geom_tile()
     + geom_rect(
         xmin=1, xmax=-1, ymin=1, ymax=3, color="white", alpha=0.1, linetype="dashed"
     )
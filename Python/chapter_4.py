@@ -24,12 +24,18 @@ It uses the pandas library for data manipulation, which is the Python equivalent
 # %%
 import pandas as pd
 import numpy as np
-from plotnine import ggplot, aes, geom_line
+from sabermetrics import rate_stats
+from aggregations import grouped_ratios
+from windows import season_windows
+from franchises import attach_franchise
+import datasets
+import figures
+import book_figures  # noqa: F401  (registers the figures)
 
 # %%
 # Load the data
 try:
-    team_batting = pd.read_csv('kbo_team_batting.csv')
+    team_batting = datasets.kbo_team_batting()
 except FileNotFoundError:
     print("Could not find kbo_team_batting.csv.")
     team_batting = pd.DataFrame()
@@ -83,25 +89,20 @@ if not team_batting.empty:
     print(team_batting[team_batting['year'] == 1982].loc[:, 'h':'hr'])
 
     # mutate(tb = ...)
-    print(team_batting[team_batting['year'] == 1982].loc[:, 'h':'hr'].assign(tb=lambda df: df['h'] + df['2b'] + 2 * df['3b'] + 3 * df['hr']))
+    print(rate_stats(team_batting[team_batting['year'] == 1982].loc[:, 'h':'hr'], stats=['tb']))
 
     # transmute(...)
-    print(team_batting.assign(avg=lambda df: df['h'] / df['ab'])[['year', 'team', 'avg']])
+    print(rate_stats(team_batting, stats=['avg'])[['year', 'team', 'avg']])
 
     # group_by and summarise
-    print(team_batting.groupby('year').apply(lambda df: pd.Series({'avg': df['h'].sum() / df['ab'].sum()})).reset_index())
+    print(grouped_ratios(team_batting, 'year', avg=('h', 'ab')))
     
-    # plotting with plotnine
-    avg_by_year = team_batting.groupby('year').apply(lambda df: pd.Series({'avg': df['h'].sum() / df['ab'].sum()})).reset_index()
-    p = (ggplot(avg_by_year, aes(x='year', y='avg')) + geom_line())
+    # plotting with plotnine, through the figure registry (see book_figures.py)
+    p = figures.chart('league_avg_by_year', 'plotnine')
     # print(p)
 
     # Complex chain of operations
-    print(team_batting.assign(
-        avg=lambda df: df['h'] / df['ab'],
-        obp=lambda df: (df['h'] + df['bb'] + df['hbp']) / (df['ab'] + df['bb'] + df['hbp'] + df['sf']),
-        slg=lambda df: (df['h'] + df['2b'] + 2 * df['3b'] + 3 * df['hr']) / df['ab']
-    ).assign(ops=lambda df: df['obp'] + df['slg']))
+    print(rate_stats(team_batting, stats=['avg', 'obp', 'slg', 'ops']))
     
     # case_when -> np.select
     conditions = [
@@ -116,17 +117,9 @@ if not team_batting.empty:
     # distinct
     print(pd.DataFrame({'value': [1, 1, 3, 3, 3, 3, 5, 5, 5, 5, 5, 5]}).drop_duplicates())
 
-    # fct_collapse -> replace
-    team_mapping = {
-        'OB': '두산', '두산': '두산',
-        '히어로즈': '키움', '넥센': '키움', '키움': '키움',
-        '빙그레': '한화', '한화': '한화',
-        '삼미': '현대', '삼미·청보': '현대', '청보': '현대', '태평양': '현대',
-        '해태': 'KIA', '해태·KIA': 'KIA', 'KIA': 'KIA',
-        'LG': 'LG', 'MBC': 'LG'
-    }
-    team_batting['team_id'] = team_batting['team'].replace(team_mapping)
-    print(team_batting.groupby('team_id')['gidp'].sum().sort_values(ascending=False))
+    # fct_collapse -> franchise lineage joined by integer code (see franchises.py)
+    team_batting = attach_franchise(team_batting, year='year')
+    print(team_batting.groupby('franchise', observed=True)['gidp'].sum().sort_values(ascending=False))
 
     # across equivalent
     print(team_batting.groupby('year').agg({
@@ -138,7 +131,7 @@ if not team_batting.empty:
     # It can be implemented with value_counts and masking.
     
     try:
-        kovo_team = pd.read_csv('kovo_team.csv')
+        kovo_team = datasets.kovo_team()
     except FileNotFoundError:
         print("Could not find kovo_team.csv'.")
         kovo_team = pd.DataFrame()
@@ -166,17 +159,23 @@ if not team_batting.empty:
         print(renamed_df)
         
         # lag/lead -> shift
-        reception_eff = kovo_team.groupby(['남녀부', '시즌']).apply(
-            lambda df: (df['리시브_정확'].sum() - df['리시브_실패'].sum()) / df['리시브_시도'].sum()
-        ).rename('리시브_효율').reset_index()
+        reception_eff = grouped_ratios(
+            kovo_team, ['남녀부', '시즌'],
+            리시브_효율=({'리시브_정확': 1, '리시브_실패': -1}, '리시브_시도'),
+        )
         
-        reception_eff['전_시즌'] = reception_eff.groupby('남녀부')['리시브_효율'].shift(1)
-        reception_eff['다음_시즌'] = reception_eff.groupby('남녀부')['리시브_효율'].shift(-1)
+        # lag, lead and diff within each 남녀부, ordered by 시즌 (see windows.py)
+        reception_eff = season_windows(reception_eff, '남녀부', metrics=['리시브_효율']).rename(
+            columns={'리시브_효율_전_시즌': '전_시즌', '리시브_효율_다음_시즌': '다음_시즌',
+                     '리시브_효율_차이': '차이'})
         print(reception_eff)
         
-        reception_eff['차이'] = reception_eff['리시브_효율'] - reception_eff['전_시즌']
-        print(reception_eff.groupby('남녀부')['차이'].mean())
-        print(reception_eff.dropna(subset=['차이']).groupby('남녀부')['차이'].mean())
+        print(reception_eff.groupby('남녀부', observed=True)['차이'].mean())
+        print(reception_eff.dropna(subset=['차이']).groupby('남녀부', observed=True)['차이'].mean())
+
+        # Year-over-year deltas for every numeric column of every team in one query
+        kovo_team_deltas = season_windows(kovo_team, ['남녀부', '팀'])
+        print(kovo_team_deltas[['시즌', '팀', '남녀부', '득점', '득점_전_시즌', '득점_차이']])
 
 # %%
 print("Conversion of chapter_4.R to Python is complete.")
@@ -23,11 +23,13 @@ It uses the pandas library for data tidying, which is the Python equivalent of t
 
 # %%
 import pandas as pd
+import datasets
+import reshape
 
 # %%
 # Load the data from the Excel file
 try:
-    kbo_untidy = pd.read_excel('kbo_team_slash_untidy.xlsx')
+    kbo_untidy = datasets.kbo_team_slash_untidy()
     print("Successfully read kbo_team_slash_untidy.xlsx'")
     print(kbo_untidy)
 except FileNotFoundError:
@@ -38,12 +40,12 @@ except FileNotFoundError:
 if not kbo_untidy.empty:
     # fill(팀) -> ffill()
     kbo_filled_down = kbo_untidy.copy()
-    kbo_filled_down['팀'] = kbo_filled_down['팀'].fillna(method='ffill')
+    kbo_filled_down['팀'] = kbo_filled_down['팀'].ffill()
     print(kbo_filled_down)
 
     # fill(팀, .direction = 'up') -> bfill()
     kbo_filled_up = kbo_untidy.copy()
-    kbo_filled_up['팀'] = kbo_filled_up['팀'].fillna(method='bfill')
+    kbo_filled_up['팀'] = kbo_filled_up['팀'].bfill()
     print(kbo_filled_up)
 
     # pivot_longer -> melt
@@ -67,22 +69,12 @@ if not kbo_untidy.empty:
     df_pivoted = df_to_pivot.pivot(index='선수', columns='기록', values='성적').reset_index()
     print(df_pivoted)
 
-    # Applying to the kbo_untidy dataframe
-    id_vars = ['팀', '구분']
-    value_vars = [col for col in kbo_untidy.columns if col not in id_vars]
-    
-    kbo_long = kbo_filled_down.melt(id_vars=id_vars, value_vars=value_vars,
-                                     var_name='연도', value_name='기록')
-    print(kbo_long)
-    print(kbo_long.sample(n=10))
-
-    # values_drop_na = TRUE
-    kbo_long_no_na = kbo_long.dropna(subset=['기록'])
-    print(kbo_long_no_na.sample(n=10))
-
-    # pivot_wider again
-    kbo_tidy = kbo_long_no_na.pivot(index=['팀', '연도'], columns='구분', values='기록').reset_index()
+    # Applying to the kbo_untidy dataframe: fill(팀), pivot_longer with
+    # values_drop_na = TRUE and pivot_wider run as one lazy plan over the
+    # cached Parquet copy of the workbook (see reshape.py)
+    kbo_tidy = reshape.kbo_tidy()
     print(kbo_tidy)
+    print(kbo_tidy.sample(n=10))
     
     # as_factor() for '연도' column can be achieved by converting to category type
     kbo_tidy['연도'] = kbo_tidy['연도'].astype('category')
@@ -18,13 +18,16 @@
 # %%
 """
 This script is a Python conversion of the R script chapter_6.R.
-It uses pandas for data manipulation and joining, and the countrycode library.
+It uses pandas for data manipulation and joining; country codes are resolved
+with countries.py instead of the countrycode library.
 """
 
 # %%
 import pandas as pd
 import numpy as np
-# import countrycode
+from team_perspective import team_perspective, team_records
+import datasets
+import soccer_pipeline
 
 # %%
 # Create the initial dataframes
@@ -64,7 +67,7 @@ print(pd.merge(homerun, teams_renamed, left_on='팀', right_on='구단', how='le
 # %%
 # International soccer matches
 try:
-    results = pd.read_csv('international_soccer_matches_results.csv', encoding="iso-8859-1")
+    results = datasets.international_soccer_matches_results()
 except FileNotFoundError:
     print("Could not find 'international_soccer_matches_results.csv'.")
     results = pd.DataFrame()
@@ -73,69 +76,21 @@ except FileNotFoundError:
 if not results.empty:
     print(results.info())
 
-    results_away = results.rename(columns={
-        'away_team': 'team',
-        'home_team': 'opponent',
-        'away_score': 'team_score',
-        'home_score': 'opponent_score'
-    })
-    
-    results_home = results.rename(columns={
-        'home_team': 'team',
-        'away_team': 'opponent',
-        'home_score': 'team_score',
-        'away_score': 'opponent_score'
-    })
+    # Long format with one row per match and side, built lazily with
+    # Categorical team columns (see team_perspective.py)
+    results_full = team_perspective(results)
+    print(results_full.head().collect())
 
-    # bind_rows -> concat
-    results_full = pd.concat([results_home, results_away], ignore_index=True)
-    
-    # Calculate wins, draws, loses
-    results_full['win'] = np.where(results_full['team_score'] > results_full['opponent_score'], 1, 0)
-    results_full['draw'] = np.where(results_full['team_score'] == results_full['opponent_score'], 1, 0)
-    results_full['lose'] = np.where(results_full['team_score'] < results_full['opponent_score'], 1, 0)
-    
-    summary = results_full.groupby('team').agg(
-        wins=('win', 'sum'),
-        draws=('draw', 'sum'),
-        loses=('lose', 'sum')
-    ).reset_index()
-    summary['matches'] = summary['wins'] + summary['draws'] + summary['loses']
-    summary['win_percent'] = summary['wins'] / summary['matches']
+    # W/D/L per team straight from the match rows, without the long table
+    summary = team_records(results)
     print(summary.sort_values(by='wins', ascending=False))
 
-    # Country code matching
-    try:
-        fifa_ranking = pd.read_csv('fifa_ranking.csv')
-    except FileNotFoundError:
-        print("Could not find 'fifa_ranking.csv'.")
-        fifa_ranking = pd.DataFrame()
-    
-    if not fifa_ranking.empty:
-        results_countries = pd.DataFrame(results[results['date'] >= '1993-08-08']['home_team'].unique(), columns=['team'])
-        fifa_ranking_countries = fifa_ranking[['country_full', 'country_abrv']].drop_duplicates()
-
-        countries_to_match = pd.merge(results_countries, fifa_ranking_countries, left_on='team', right_on='country_full', how='left')
-        countries_to_match = countries_to_match[countries_to_match['country_abrv'].isna()]
-
-        def get_country_code(country_name):
-            try:
-                return countrycode.countrycode(country_name, origin='country.name', destination='iso3c')
-            except:
-                return None
-        
-        countries_to_match['country_abrv'] = countries_to_match['team'].apply(get_country_code)
-
-        country_codes_result = countries_to_match.dropna(subset=['country_abrv'])
-        
-        # This is a simplified version of the R code's logic for creating country_code_result
-        # A more robust solution would involve combining the matched and unmatched dataframes.
-
-        # The rest of the script involves more complex joins and data cleaning that would require careful, step-by-step implementation.
-        # This simplified version demonstrates the core concepts.
-
-        # Save to csv
-        results_full[results_full['date'] > '1993-08-08'].to_csv('soccer_matches_results_in_progress.csv', index=False)
+    # Country code matching, team perspective and the codes of both sides run
+    # as SQLMesh models (see soccer_models/ and countries.py); chapter 7 reads
+    # the soccer.results_in_progress table they maintain
+    soccer_pipeline.run()
+    country_code_result = soccer_pipeline.country_codes(refresh=False)
+    print(country_code_result[country_code_result['country_abrv'].isna()])
 
 # %%
 print("Conversion of chapter_6.R to Python is complete.")
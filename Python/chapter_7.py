@@ -24,6 +24,9 @@ It uses pandas for date and time manipulation.
 # %%
 import pandas as pd
 import numpy as np
+from rankings import prepare_rankings, attach_ranks
+import datasets
+import soccer_pipeline
 
 # %%
 # Date parsing
@@ -36,7 +39,7 @@ print(pd.to_datetime('1-jan-2021'))
 # %%
 # Load data
 try:
-    kbo_profile = pd.read_csv('kbo_players_profiles.csv')
+    kbo_profile = datasets.kbo_players_profiles()
 except FileNotFoundError:
     print("Could not find kbo_players_profiles.csv.")
     kbo_profile = pd.DataFrame()
@@ -74,14 +77,11 @@ date_with_tz = pd.to_datetime('1982-03-27 14:30').tz_localize('Asia/Seoul')
 print(date_with_tz)
 print(date_with_tz.tz_convert('America/New_York'))
 
-# %%
-pd.read_csv('soccer_matches_results_in_progress.csv', encoding="iso-8859-1")
-
 # %%
 # Joining soccer data
 try:
-    fifa_ranking = pd.read_csv('fifa_ranking.csv')
-    results_in_progress = pd.read_csv('soccer_matches_results_in_progress.csv', encoding="iso-8859-1")
+    fifa_ranking = datasets.fifa_ranking()
+    results_in_progress = soccer_pipeline.results_in_progress()
 except FileNotFoundError:
     print("Could not find required soccer data files.")
     fifa_ranking = pd.DataFrame()
@@ -89,37 +89,20 @@ except FileNotFoundError:
 
 # %%
 if not fifa_ranking.empty and not results_in_progress.empty:
-    fifa_ranking['rank_date'] = pd.to_datetime(fifa_ranking['rank_date'])
-    fifa_ranking['floor_date'] = fifa_ranking['rank_date'].dt.to_period('M').dt.to_timestamp()
-    fifa_ranking['previous_rank'] = fifa_ranking.groupby('country_full')['rank'].shift(1)
+    # Rank history per country with the previous rank (see rankings.py)
+    fifa_ranking_to_join = prepare_rankings(fifa_ranking)
 
-    results_in_progress['date'] = pd.to_datetime(results_in_progress['date'])
-    results_in_progress['floor_date'] = results_in_progress['date'].dt.to_period('M').dt.to_timestamp()
+    # As-of join: attach the most recent ranking on or before each match date,
+    # for both the team and the opponent
+    results_with_rank = attach_ranks(results_in_progress, fifa_ranking_to_join)
 
-    # The joins are complex and require careful alignment of column names.
-    # This is a simplified demonstration.
-    
-    # First join for the team
-    results_with_rank = pd.merge(results_in_progress,
-                                 fifa_ranking,
-                                 left_on=['team_abrv', 'floor_date'],
-                                 right_on=['country_abrv', 'floor_date'],
-                                 how='left')
-    results_with_rank = results_with_rank.rename(columns={'rank': 'team_rank', 'previous_rank': 'team_previous_rank'})
-
-    # Second join for the opponent
-    results_with_rank = pd.merge(results_with_rank,
-                                 fifa_ranking,
-                                 left_on=['opponent_abrv', 'floor_date'],
-                                 right_on=['country_abrv', 'floor_date'],
-                                 how='left',
-                                 suffixes=('_team', '_opponent'))
-    results_with_rank = results_with_rank.rename(columns={'rank': 'opponent_rank', 'previous_rank': 'opponent_previous_rank'})
-
-    # Logic to select correct rank based on date difference
-    # This requires careful handling of date comparisons row by row or with vectorization.
-    
-    print("Complex join logic would follow here.")
+    results_final = results_with_rank[['date', 'team', 'opponent', 'team_score', 'opponent_score',
+                                       'tournament', 'team_rank', 'opponent_rank']].copy()
+    results_final['win'] = np.where(results_final['team_score'] > results_final['opponent_score'], 1, 0)
+    print(results_final)
+
+    print(results_final[(results_final['team'] == 'South Korea') & (results_final['win'] == 1)].sort_values(by='opponent_rank'))
+    print(results_final[(results_final['win'] == 1) & (results_final['opponent_rank'] == 1)].sort_values(by='team_rank', ascending=False))
 
 
 # %%
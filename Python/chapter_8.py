@@ -27,18 +27,15 @@ import numpy as np
 from scipy.special import comb
 from scipy.stats import binom, norm
 from plotnine import ggplot, aes, geom_line, geom_col, geom_histogram, coord_cartesian, stat_function
-import math
+from pbirthday import pbirthday
+from birthday import simulate_birthday_paradox, simulate_birthday_sweep
 
 # %%
 # choose(45, 6)
 print(comb(45, 6))
 
 # %%
-# pbirthday is not directly available in scipy, so we define it
-def pbirthday(n):
-    if n > 365:
-        return 1.0
-    return 1.0 - math.prod((365 - i) / 365 for i in range(n))
+# pbirthday is not directly available in scipy, so it lives in pbirthday.py
 
 # %%
 print(pbirthday(28))
@@ -48,25 +45,14 @@ np.random.seed(1234)
 
 # %%
 # Simulation of birthday paradox
-def simulate_birthday_paradox(reps, size):
-    days = np.arange(1, 366)
-    simulations = [pd.DataFrame({'day': np.random.choice(days, size=size, replace=True)}) for _ in range(reps)]
-    results = [sim['day'].duplicated().any() for sim in simulations]
-    return np.mean(results)
+# Each repetition is a row of one integer matrix (see birthday.py)
+rng = np.random.default_rng(1234)
+print(simulate_birthday_paradox(reps=100, size=28, rng=rng))
 
 # %%
-print(simulate_birthday_paradox(reps=100, size=28))
-
-# %%
-# Run simulation for different group sizes
+# Run simulation for different group sizes in a single sweep
 person_counts = range(2, 76)
-birthday_simulation_results = [simulate_birthday_paradox(reps=1000, size=n) for n in person_counts]
-
-# %%
-birthday_paradox_simulation = pd.DataFrame({
-    '사람': person_counts,
-    '결과': birthday_simulation_results
-})
+birthday_paradox_simulation = simulate_birthday_sweep(reps=1000, sizes=person_counts, rng=rng)
 
 # %%
 print(birthday_paradox_simulation[birthday_paradox_simulation['결과'] >= 0.5].head(1))
@@ -79,7 +65,7 @@ p
 
 # %%
 # Add theoretical probability
-birthday_paradox_simulation['확률'] = [pbirthday(n) for n in person_counts]
+birthday_paradox_simulation['확률'] = pbirthday(birthday_paradox_simulation['사람'])
 p = (ggplot(birthday_paradox_simulation, aes(x='사람')) +
      geom_line(aes(y='확률'), size=2.5, color='#53bfd4', alpha=0.25) +
      geom_line(aes(y='결과'), size=0.75) +
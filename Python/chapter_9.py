@@ -25,7 +25,9 @@ It focuses on sampling, resampling, and the Central Limit Theorem using pandas a
 import pandas as pd
 import numpy as np
 from plotnine import ggplot, aes, geom_histogram, geom_vline, geom_density, facet_grid
-import itertools
+from clt import sample_mean_batches, summarize_sample_means
+import polars as pl
+import datasets
 
 # %%
 np.random.seed(1234)
@@ -33,7 +35,7 @@ np.random.seed(1234)
 # %%
 # Load data
 try:
-    gocheock_attendance = pd.read_csv('gocheock_attendance.csv')
+    gocheock_attendance = datasets.gocheock_attendance()
 except FileNotFoundError:
     print("Could not find gocheock_attendance.csv.")
     gocheock_attendance = pd.DataFrame()
@@ -87,23 +89,13 @@ p = (ggplot(population1, aes(x='x')) +
 # 2. Simulate sampling and calculate sample means
 sizes = [1, 5, 10, 30, 50, 1000]
 reps_list = [10, 100, 1000, 10000]
-simulation_params = list(itertools.product(sizes, reps_list))
 
 # %%
-all_sample_means = []
+# Sample means are drawn in batched NumPy chunks and streamed as Polars batches (see clt.py)
+sample_mean_batches_list = list(sample_mean_batches(population1['x'], sizes, reps_list, rng=1234))
 
 # %%
-for size, reps in simulation_params:
-    sample_means = [population1['x'].sample(n=size, replace=True).mean() for _ in range(reps)]
-    df = pd.DataFrame({
-        'sample_mean': sample_means,
-        'size': size,
-        'reps': reps
-    })
-    all_sample_means.append(df)
-
-# %%
-sample_mean_tbl = pd.concat(all_sample_means, ignore_index=True)
+sample_mean_tbl = pl.concat(sample_mean_batches_list).to_pandas()
 
 # %%
 # 3. Plot the distribution of sample means
@@ -115,9 +107,8 @@ p = (ggplot(sample_mean_tbl, aes(x='sample_mean')) +
 
 # %%
 # 4. Analyze the results
-clt_summary = sample_mean_tbl.groupby('size')['sample_mean'].agg(['mean', 'std']).reset_index()
-clt_summary = clt_summary.rename(columns={'std': 'se'})
-clt_summary['theoretical_se'] = population1['x'].std() / np.sqrt(clt_summary['size'])
+# The summary is computed online from the batches, so it does not need sample_mean_tbl
+clt_summary = summarize_sample_means(sample_mean_batches_list, population1['x'])
 
 # %%
 print(clt_summary)
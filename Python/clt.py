@@ -0,0 +1,74 @@
+"""
+Streaming Central Limit Theorem simulation.
+
+Sample means for a grid of sample sizes and repetition counts are drawn as
+batched NumPy index matrices from the population array, chunked so no single
+draw exceeds `max_cells` values, and yielded as Polars DataFrames (call
+`.to_arrow()` on a batch for an Arrow table). `summarize_sample_means` consumes the
+batches with an online (Welford/Chan) update, so the SE comparison never needs
+the full sample-mean table in memory.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+MAX_CELLS = 2**22
+
+
+def sample_mean_batches(population, sizes, reps_list, rng=None, max_cells=MAX_CELLS):
+    """Yield batches of sample means with the columns sample_mean, size and reps."""
+    rng = np.random.default_rng(rng)
+    population = np.asarray(population, dtype=np.float64)
+    for size, reps in itertools.product(sizes, reps_list):
+        chunk = max(1, max_cells // size)
+        for start in range(0, reps, chunk):
+            n_rows = min(chunk, reps - start)
+            draws = population[rng.integers(0, len(population), size=(n_rows, size))]
+            yield pl.DataFrame({'sample_mean': draws.mean(axis=1)}).with_columns(
+                size=pl.lit(size, dtype=pl.Int64),
+                reps=pl.lit(reps, dtype=pl.Int64),
+            )
+
+
+def summarize_sample_means(batches, population):
+    """
+    Mean and SE of the sample means per size, next to the theoretical SE.
+
+    Each batch is reduced to (count, mean, M2) per size and merged into the
+    running totals with Chan's parallel form of Welford's update.
+    """
+    totals = {}
+    for batch in batches:
+        moments = batch.group_by('size').agg(
+            count=pl.len(),
+            mean=pl.col('sample_mean').mean(),
+            m2=((pl.col('sample_mean') - pl.col('sample_mean').mean()) ** 2).sum(),
+        )
+        for size, count, mean, m2 in moments.iter_rows():
+            if size not in totals:
+                totals[size] = (count, mean, m2)
+                continue
+            total_count, total_mean, total_m2 = totals[size]
+            merged_count = total_count + count
+            delta = mean - total_mean
+            totals[size] = (
+                merged_count,
+                total_mean + delta * count / merged_count,
+                total_m2 + m2 + delta ** 2 * total_count * count / merged_count,
+            )
+
+    sizes = sorted(totals)
+    counts = np.array([totals[size][0] for size in sizes], dtype=np.float64)
+    m2s = np.array([totals[size][2] for size in sizes])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se = np.sqrt(m2s / (counts - 1))
+    summary = pd.DataFrame({
+        'size': sizes,
+        'mean': [totals[size][1] for size in sizes],
+        'se': se,
+    })
+    summary['theoretical_se'] = np.std(population, ddof=1) / np.sqrt(summary['size'])
+    return summary
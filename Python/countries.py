@@ -0,0 +1,131 @@
+"""
+Resolve international-results team names to FIFA country codes.
+
+The match results spell countries differently from `fifa_ranking.csv`
+('South Korea' vs 'Korea Republic', 'Curacao' vs 'Curaçao'). Names are
+normalized (accents, case, punctuation, 'St.' -> 'saint') and looked up in an
+index built from `country_full`/`country_abrv` plus the offline ALIASES table;
+only names still unmatched fall back to a close-match search. Resolution runs
+once over the ~300 unique names and is joined back onto the rows, and the
+mapping is persisted to a CSV cache in R/.parquet so later runs skip matching
+entirely. The cache file is keyed by a digest of ALIASES, the rankings' names
+and the cutoff, so editing any of them starts a fresh cache.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+import datasets
+
+# Results spelling -> FIFA country_full, for names normalization cannot bridge
+ALIASES = {
+    'South Korea': 'Korea Republic',
+    'North Korea': 'Korea DPR',
+    'Iran': 'IR Iran',
+    'Ivory Coast': "Côte d'Ivoire",
+    'DR Congo': 'Congo DR',
+    'Cape Verde': 'Cabo Verde',
+    'Brunei': 'Brunei Darussalam',
+    'Kyrgyzstan': 'Kyrgyz Republic',
+    'United States': 'USA',
+    'U.S. Virgin Islands': 'US Virgin Islands',
+    'Eswatini': 'Swaziland',
+    'Burma': 'Myanmar',
+    'East Timor': 'Timor-Leste',
+    'Saint Vincent and the Grenadines': 'St. Vincent / Grenadines',
+}
+
+
+def normalize_names(names):
+    """Accent-, case- and punctuation-insensitive keys for a Series of names."""
+    return (names.astype(str)
+            .str.normalize('NFKD')
+            .str.encode('ascii', errors='ignore').str.decode('ascii')
+            .str.casefold()
+            .str.replace(r'\bst\b\.?', 'saint', regex=True)
+            .str.replace('&', ' and ', regex=False)
+            .str.replace(r'[^a-z0-9]+', ' ', regex=True)
+            .str.strip())
+
+
+def build_index(fifa_ranking, aliases=ALIASES):
+    """Map normalized name -> country_abrv from the rankings and the alias table."""
+    countries = (fifa_ranking[['country_full', 'country_abrv']]
+                 .dropna().drop_duplicates(subset='country_full'))
+    codes = pd.Series(countries['country_abrv'].to_numpy(),
+                      index=countries['country_full'])
+    alias_names = pd.Series(list(aliases))
+    alias_codes = codes.reindex(list(aliases.values())).to_numpy()
+    names = pd.concat([countries['country_full'], alias_names], ignore_index=True)
+    abrvs = pd.concat([countries['country_abrv'], pd.Series(alias_codes)],
+                      ignore_index=True)
+    index = pd.Series(abrvs.to_numpy(), index=normalize_names(names).to_numpy())
+    index = index.dropna()
+    return index[~index.index.duplicated(keep='first')]
+
+
+def resolve_names(names, index, cutoff=0.9):
+    """
+    country_abrv for each unique name in `names`, as a Series indexed by name.
+
+    Exact lookups on the normalized key are vectorized; only the leftovers go
+    through difflib with a strict `cutoff`. Unresolved names map to NaN.
+    """
+    unique = pd.Series(pd.unique(pd.Series(names).dropna()))
+    keys = normalize_names(unique)
+    codes = pd.Series(index.reindex(keys.to_numpy()).to_numpy(),
+                      index=unique.to_numpy())
+    candidates = list(index.index)
+    for name, key in zip(unique[codes.isna().to_numpy()],
+                         keys[codes.isna().to_numpy()]):
+        match = difflib.get_close_matches(key, candidates, n=1, cutoff=cutoff)
+        if match:
+            codes[name] = index[match[0]]
+    return codes
+
+
+def load_cache(path):
+    """Cached team -> country_abrv mapping, or an empty one if there is no cache."""
+    if path is None or not os.path.exists(path):
+        return pd.Series(dtype=object)
+    cache = pd.read_csv(path, keep_default_na=False, na_values=[''])
+    return pd.Series(cache['country_abrv'].to_numpy(), index=cache['team'].to_numpy())
+
+
+def cache_path(fifa_ranking, cache_dir=datasets.CACHE_DIR, aliases=ALIASES, cutoff=0.9):
+    """Cache file for this alias table, rankings and cutoff."""
+    countries = (fifa_ranking[['country_full', 'country_abrv']]
+                 .dropna().drop_duplicates().sort_values(['country_full', 'country_abrv']))
+    digest = hashlib.sha1(json.dumps(
+        [sorted(aliases.items()), countries.to_numpy().tolist(), cutoff],
+        ensure_ascii=False).encode())
+    return os.path.join(cache_dir, f'country_codes.{digest.hexdigest()[:8]}.csv')
+
+
+def country_codes(names, fifa_ranking, cache_dir=datasets.CACHE_DIR, cutoff=0.9):
+    """
+    team -> country_abrv table for every unique name in `names`.
+
+    Names already in the cache under `cache_dir` are not re-resolved
+    (including ones cached as unresolved); new names are resolved and
+    appended. The cache file is specific to ALIASES, the rankings and
+    `cutoff` (see cache_path). Pass cache_dir=None to skip the cache.
+    """
+    path = None if cache_dir is None else cache_path(fifa_ranking, cache_dir, cutoff=cutoff)
+    cached = load_cache(path)
+    unique = list(pd.Series(names).dropna().unique())
+    missing = [name for name in unique if name not in cached.index]
+    if missing:
+        resolved = resolve_names(missing, build_index(fifa_ranking), cutoff=cutoff)
+        cached = pd.concat([cached, resolved])
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            (cached.rename_axis('team').rename('country_abrv').reset_index()
+             .to_csv(path, index=False))
+    return (cached.reindex(unique).rename_axis('team').rename('country_abrv')
+            .reset_index())
+
@@ -0,0 +1,181 @@
+"""
+Streamlit dashboard over the sports datasets.
+
+    streamlit run dashboard.py
+
+Every number is a DuckDB query against the catalog views (see catalog.py),
+which scan the Parquet copies in R/.parquet. The league, season and team
+filters are bound as query parameters, so DuckDB prunes rows and columns while
+scanning instead of the app filtering a loaded frame. The catalog connection is
+shared by all sessions through `st.cache_resource` (each query gets its own
+cursor) and results are memoized per SQL and parameters with `st.cache_data`,
+so repeating a filter combination does not touch DuckDB at all.
+"""
+
+import streamlit as st
+
+import catalog
+import pythagorean as pythag
+
+BATTING_STATS = ['avg', 'obp', 'slg', 'ops', 'hr', 'rbi']
+KOVO_STATS = ['리시브효율', '서브효율', '공격효율', '블로킹', '디그', '득점']
+
+
+@st.cache_resource
+def _connection():
+    return catalog.connect()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _query(sql, params=()):
+    # list parameters arrive as tuples so that st.cache_data can hash them
+    params = [list(value) if isinstance(value, tuple) else value for value in params]
+    return catalog.query(sql, params, con=_connection().cursor()).to_pandas()
+
+
+def _options(table, column, where='TRUE', params=()):
+    sql = f'SELECT DISTINCT "{column}" FROM {table} WHERE {where} ORDER BY 1'
+    return _query(sql, tuple(params))[column].tolist()
+
+
+def _in_list(column):
+    """SQL condition matching `column` against a list parameter; an empty list matches all."""
+    return f'(len(?::TEXT[]) = 0 OR list_contains(?::TEXT[], "{column}"::TEXT))'
+
+
+def win_rates():
+    st.header('Win rates by venue and period')
+    table = st.sidebar.radio('Data', ['uefa_big_5_19_20', 'nba_19_20'],
+                             format_func={'uefa_big_5_19_20': 'UEFA big 5',
+                                          'nba_19_20': 'NBA'}.get)
+    leagues = st.sidebar.multiselect('League', _options(table, '리그'))
+    teams = st.sidebar.multiselect(
+        'Team', _options(table, '팀', _in_list('리그'), (tuple(leagues),) * 2))
+    by = st.sidebar.radio('Split by', ['장소', '시기'])
+    rates = _query(f"""
+        SELECT 팀, "{by}"::TEXT AS "{by}", avg(승리) AS 승률, count(*) AS 경기
+        FROM {table}
+        WHERE {_in_list('리그')} AND {_in_list('팀')}
+        GROUP BY ALL
+        ORDER BY 팀, "{by}"
+    """, (tuple(leagues),) * 2 + (tuple(teams),) * 2)
+    st.bar_chart(rates, x='팀', y='승률', color=by, stack=False)
+    st.dataframe(rates, hide_index=True)
+
+
+@st.cache_data(show_spinner=False)
+def _pythagorean_fit():
+    teams = _query('SELECT * FROM kbo_pythagorean_expectation')
+    return float(pythag.fit_exponent(teams)['param'].iloc[0])
+
+
+def pythagorean():
+    st.header('Pythagorean expectation (KBO)')
+    low, high = _query('SELECT min(연도) AS low, max(연도) AS high '
+                       'FROM kbo_pythagorean_expectation').iloc[0]
+    years = st.sidebar.slider('Season', int(low), int(high),
+                              (max(int(low), int(high) - 10), int(high)))
+    teams = st.sidebar.multiselect('Team', _options('kbo_pythagorean_expectation', '팀'))
+    fitted = _pythagorean_fit()
+    st.sidebar.caption(f'Least-squares exponent, all seasons: {fitted:.3f}')
+    exponent = st.sidebar.slider('Exponent', 1.0, 3.0, round(fitted, 2), 0.01)
+    table = _query(f"""
+        SELECT 연도, 팀::TEXT AS 팀, 경기, 승, 패, 득점, 실점,
+               승 / (승 + 패) AS 승률,
+               pow(득점, ?) / (pow(득점, ?) + pow(실점, ?)) AS 기대_승률
+        FROM kbo_pythagorean_expectation
+        WHERE 연도 BETWEEN ? AND ? AND {_in_list('팀')}
+        ORDER BY 연도 DESC, 승률 DESC
+    """, (exponent,) * 3 + tuple(years) + (tuple(teams),) * 2)
+    st.scatter_chart(table, x='기대_승률', y='승률', color='연도')
+    error = (table['승률'] - table['기대_승률']).pow(2).mean() ** 0.5
+    st.metric('RMSE of win%', f'{error:.4f}')
+    st.dataframe(table, hide_index=True)
+
+
+def batting_leaders():
+    st.header('Batting leaders (KBO, qualified)')
+    low, high = _query('SELECT min(year) AS low, max(year) AS high '
+                       'FROM kbo_batting_qualified').iloc[0]
+    years = st.sidebar.slider('Season', int(low), int(high), (int(high), int(high)))
+    stat = st.sidebar.selectbox('Stat', BATTING_STATS)
+    top = st.sidebar.number_input('Top', 5, 100, 10)
+    leaders = _query(f"""
+        SELECT name, year, avg, obp, slg, ops, hr, rbi
+        FROM kbo_batting_qualified
+        WHERE year BETWEEN ? AND ?
+        ORDER BY "{stat}" DESC
+        LIMIT ?
+    """, tuple(years) + (int(top),))
+    st.dataframe(leaders, hide_index=True)
+
+
+def fifa_ranking():
+    st.header('FIFA ranking history')
+    options = _options('fifa_ranking', 'country_full')
+    countries = st.sidebar.multiselect(
+        'Country', options, default=[name for name in ['Korea Republic'] if name in options])
+    ranks = _query(f"""
+        SELECT rank_date, country_full, rank
+        FROM fifa_ranking
+        WHERE {_in_list('country_full')}
+        ORDER BY rank_date
+    """, (tuple(countries),) * 2)
+    st.line_chart(ranks, x='rank_date', y='rank', color='country_full')
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _team_records(since, until, tournaments):
+    return catalog.team_records(since, until, list(tournaments) or None,
+                                con=_connection().cursor()).to_pandas()
+
+
+def international_results():
+    st.header('International results')
+    low, high = _query('SELECT year(min(date)) AS low, year(max(date)) AS high '
+                       'FROM international_soccer_matches_results').iloc[0]
+    years = st.sidebar.slider('Year', int(low), int(high), (1993, int(high)))
+    tournaments = st.sidebar.multiselect(
+        'Tournament', _options('international_soccer_matches_results', 'tournament'))
+    top = st.sidebar.number_input('Top', 5, 300, 20)
+    # the same W/D/L query chapter 6 uses (catalog.team_records)
+    records = _team_records(f'{years[0] - 1}-12-31', f'{years[1]}-12-31', tuple(tournaments))
+    records = records.sort_values('wins', ascending=False, kind='stable').head(int(top))
+    st.dataframe(records, hide_index=True)
+
+
+def kovo_sets():
+    st.header('KOVO set-by-set: winners vs losers')
+    seasons = st.sidebar.multiselect('Season', _options('kovo_set_by_set', '시즌'))
+    division = st.sidebar.radio('Division', _options('kovo_set_by_set', '남녀부'))
+    teams = st.sidebar.multiselect(
+        'Team', _options('kovo_set_by_set', '플레이팀', '남녀부 = ?', (division,)))
+    averages = ', '.join(f'avg("{stat}") AS "{stat}"' for stat in KOVO_STATS)
+    table = _query(f"""
+        SELECT 승리, count(*) AS 세트, {averages}
+        FROM kovo_set_by_set
+        WHERE 남녀부 = ? AND {_in_list('시즌')} AND {_in_list('플레이팀')}
+        GROUP BY 승리
+        ORDER BY 승리 DESC
+    """, (division,) + (tuple(seasons),) * 2 + (tuple(teams),) * 2)
+    st.dataframe(table, hide_index=True)
+
+
+PAGES = {
+    'Win rates': win_rates,
+    'Pythagorean expectation': pythagorean,
+    'Batting leaders': batting_leaders,
+    'FIFA ranking': fifa_ranking,
+    'International results': international_results,
+    'KOVO sets': kovo_sets,
+}
+
+
+def main():
+    st.set_page_config(page_title='Sports data', layout='wide')
+    page = st.sidebar.selectbox('Page', list(PAGES))
+    PAGES[page]()
+
+
+if __name__ == '__main__':
+    main()
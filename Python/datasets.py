@@ -0,0 +1,200 @@
+"""
+Cached loaders for the data files in R/.
+
+Each file has one loader (`kbo_team_batting()`, `fifa_ranking()`, ...) that
+resolves the path from the project root with pyprojroot and applies the schema
+declared in SCHEMAS: read options, parsed date columns and categoricals (팀,
+장소, 시기, ...). The first load of a file parses it and writes a Parquet copy
+to R/.parquet, keyed by the source file's mtime and size and by its schema;
+later processes read that copy, with column projection when `columns` is
+given. For the untidy Excel sheet this skips the workbook parser, the slowest
+reader in the repo; its integer year headers are stored as strings, since
+Parquet column names must be strings. Within a process, results are kept in an
+LRU cache, and loaders return a copy so callers can modify their frame freely.
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+import pandas as pd
+from pyprojroot.here import here
+
+import statcast
+
+DATA_DIR = here('R')
+CACHE_DIR = DATA_DIR / '.parquet'
+
+VENUE = pd.CategoricalDtype(['안방', '방문'], ordered=True)
+PERIOD = pd.CategoricalDtype(['BC', 'AC'], ordered=True)
+
+# file name -> read options, date columns ({column: format}) and dtypes
+SCHEMAS = {
+    # 팀 and 상대 stay strings: the chapters group these by team after filtering
+    # out a league, and a categorical key would bring the dropped teams back as NaN
+    '19_20_nba.csv': {
+        'dates': {'날짜': '%Y-%m-%d'},
+        'dtypes': {'장소': VENUE, '시기': PERIOD, '리그': 'category'},
+    },
+    '19_20_uefa_big_5.csv': {
+        'dates': {'날짜': '%Y-%m-%d'},
+        'dtypes': {'리그': 'category', '장소': VENUE, '시기': PERIOD},
+    },
+    '2020_kbo_team_batting.csv': {
+        'dtypes': {'team': 'category'},
+    },
+    '2020_ryu.csv': {
+        'read': statcast.read_options(),
+        'dates': {'game_date': '%Y-%m-%d'},
+    },
+    'cheonan_attendance.csv': {
+        'dtypes': {'성별': 'category'},
+    },
+    'fifa_ranking.csv': {
+        'dates': {'rank_date': '%Y-%m-%d'},
+        'dtypes': {'confederation': 'category'},
+    },
+    'gocheock_attendance.csv': {
+        'dtypes': {'성별': 'category'},
+    },
+    'international_soccer_matches_results.csv': {
+        'read': {'encoding': 'iso-8859-1'},
+        'dates': {'date': '%Y-%m-%d'},
+        'dtypes': {'tournament': 'category'},
+    },
+    'kbo_batting_bayesian.csv': {},
+    'kbo_batting_qualified.csv': {},
+    'kbo_batting_risp.csv': {},
+    'kbo_players_profiles.csv': {
+        'dtypes': {'투타': 'category', '포지션': 'category'},
+    },
+    'kbo_pythagorean_expectation.csv': {
+        'dtypes': {'팀': 'category'},
+    },
+    'kbo_team_batting.csv': {
+        'dtypes': {'team': 'category'},
+    },
+    'kbo_team_slash_untidy.xlsx': {},
+    'kovo_set_by_set.csv': {
+        'dtypes': {'남녀부': 'category', '플레이팀': 'category'},
+    },
+    'kovo_sets_results.csv': {
+        'dtypes': {'남녀부': 'category', '플레이팀': 'category'},
+    },
+    'kovo_team.csv': {
+        'dtypes': {'팀': 'category', '남녀부': 'category'},
+    },
+    'nba_draft_data.csv': {
+        'read': {'encoding': 'iso-8859-1'},
+        'dtypes': {'team': 'category'},
+    },
+    'tennis_big3_results.csv': {
+        'dates': {'Date': '%d-%m-%Y'},
+        'dtypes': {'Player': 'category', 'Tournament': 'category',
+                   'Surface': 'category', 'Round': 'category', 'W/L': 'category'},
+    },
+}
+
+
+def _read_source(name):
+    """Parse a data file and apply its declared schema."""
+    schema = SCHEMAS[name]
+    path = DATA_DIR / name
+    if path.suffix == '.xlsx':
+        frame = pd.read_excel(path, **schema.get('read', {}))
+        frame.columns = frame.columns.map(str)
+    else:
+        frame = pd.read_csv(path, **schema.get('read', {}))
+    for column, date_format in schema.get('dates', {}).items():
+        frame[column] = pd.to_datetime(frame[column], format=date_format)
+    return frame.astype(schema.get('dtypes', {}))
+
+
+def _schema_digest(name):
+    schema = SCHEMAS[name]
+    read = schema.get('read', {})
+    if callable(read.get('usecols')):
+        # A callable serializes as its name only, so hash the columns it keeps
+        # (editing statcast.DEPRECATED must invalidate the copy)
+        header = pd.read_csv(DATA_DIR / name, nrows=0, encoding=read.get('encoding')).columns
+        usecols = [column for column in header if read['usecols'](column)]
+        schema = {**schema, 'read': {**read, 'usecols': usecols}}
+    text = json.dumps(schema, sort_keys=True,
+                      default=lambda value: getattr(value, '__qualname__', None) or repr(value))
+    return hashlib.sha1(text.encode()).hexdigest()[:8]
+
+
+def parquet_path(name):
+    """
+    Path of the Parquet copy of `name`, writing it first if it is missing or stale.
+
+    The copy is keyed by the source file's mtime and size and by a digest of
+    its schema, so editing the CSV or the schema invalidates it; older copies
+    of the same file are removed.
+    """
+    if name not in SCHEMAS:
+        raise KeyError(f'no schema declared for {name!r}')
+    stat = os.stat(DATA_DIR / name)
+    stem = name.rsplit('.', 1)[0]
+    path = CACHE_DIR / f'{stem}.{stat.st_mtime_ns}-{stat.st_size}-{_schema_digest(name)}.parquet'
+    if not path.exists():
+        CACHE_DIR.mkdir(exist_ok=True)
+        frame = _read_source(name)
+        # Write under a temporary name so a concurrent reader never sees half a file
+        partial = path.with_suffix(f'.{os.getpid()}.tmp')
+        frame.to_parquet(partial, index=False)
+        os.replace(partial, path)
+        # Other processes may be cleaning up too (chapters run in parallel), so
+        # the current copy is never touched and a file already gone is fine
+        for stale in CACHE_DIR.glob(f'{stem}.*.parquet'):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(name, columns):
+    return pd.read_parquet(parquet_path(name),
+                           columns=list(columns) if columns is not None else None)
+
+
+def load(name, columns=None):
+    """Load a data file from R/ by name, optionally only `columns`, as a new DataFrame."""
+    columns = tuple(columns) if columns is not None else None
+    return _load_cached(name, columns).copy()
+
+
+def clear_cache():
+    """Drop the in-process cache; the Parquet copies on disk are kept."""
+    _load_cached.cache_clear()
+
+
+def _loader(name):
+    def loader(columns=None):
+        return load(name, columns)
+    loader.__name__ = name.rsplit('.', 1)[0]
+    loader.__doc__ = f'Load {name} (see SCHEMAS), optionally only `columns`.'
+    return loader
+
+
+nba_19_20 = _loader('19_20_nba.csv')
+uefa_big_5_19_20 = _loader('19_20_uefa_big_5.csv')
+kbo_team_batting_2020 = _loader('2020_kbo_team_batting.csv')
+ryu_2020 = _loader('2020_ryu.csv')
+cheonan_attendance = _loader('cheonan_attendance.csv')
+fifa_ranking = _loader('fifa_ranking.csv')
+gocheock_attendance = _loader('gocheock_attendance.csv')
+international_soccer_matches_results = _loader('international_soccer_matches_results.csv')
+kbo_batting_bayesian = _loader('kbo_batting_bayesian.csv')
+kbo_batting_qualified = _loader('kbo_batting_qualified.csv')
+kbo_batting_risp = _loader('kbo_batting_risp.csv')
+kbo_players_profiles = _loader('kbo_players_profiles.csv')
+kbo_pythagorean_expectation = _loader('kbo_pythagorean_expectation.csv')
+kbo_team_batting = _loader('kbo_team_batting.csv')
+kbo_team_slash_untidy = _loader('kbo_team_slash_untidy.xlsx')
+kovo_set_by_set = _loader('kovo_set_by_set.csv')
+kovo_sets_results = _loader('kovo_sets_results.csv')
+kovo_team = _loader('kovo_team.csv')
+nba_draft_data = _loader('nba_draft_data.csv')
+tennis_big3_results = _loader('tennis_big3_results.csv')
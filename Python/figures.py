@@ -0,0 +1,101 @@
+"""
+Figure registry with an on-disk cache of rendered output.
+
+A figure is declared once with `register(name, query, **renderers)`: `query`
+returns the figure's data and each renderer turns that data into a chart for
+one backend (altair, matplotlib, plotnine, lets_plot, ...). `render` saves the
+chart under FIGURE_DIR with a file name keyed by a hash of the data, the
+renderer's source and the output format. If that file already exists, the
+figure is not re-rendered, so `render_all` only redraws figures whose data or
+spec changed. The chapters draw registered figures with `chart`, which returns
+the chart object for display instead of saving it.
+"""
+
+import hashlib
+import inspect
+
+import pandas as pd
+import polars as pl
+from pyprojroot.here import here
+
+FIGURE_DIR = here('Python') / 'figures'
+
+_figures = {}
+
+
+def register(name, query, **renderers):
+    """Declare figure `name` with its data `query` and one renderer per backend."""
+    if not renderers:
+        raise ValueError(f'figure {name!r} needs at least one renderer')
+    _figures[name] = {'query': query, 'renderers': renderers}
+
+
+def figure_names(backend=None):
+    """Registered figure names, optionally only those with a `backend` renderer."""
+    return [name for name, entry in _figures.items()
+            if backend is None or backend in entry['renderers']]
+
+
+def chart(name, backend='altair'):
+    """Figure `name` drawn with `backend` from a fresh query, without saving it."""
+    entry = _figures[name]
+    return entry['renderers'][backend](entry['query']())
+
+
+def _data_digest(data):
+    if isinstance(data, pl.DataFrame):
+        values = data.hash_rows(seed=0).to_numpy()
+        columns = repr(data.schema)
+    else:
+        values = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        columns = repr(list(data.columns)) + repr(list(data.dtypes.astype(str)))
+    digest = hashlib.sha1(values.tobytes())
+    digest.update(columns.encode())
+    return digest
+
+
+def _spec_source(renderer):
+    try:
+        return inspect.getsource(renderer)
+    except (OSError, TypeError):
+        return getattr(renderer, '__qualname__', repr(renderer))
+
+
+def _save(chart, path):
+    if hasattr(chart, 'savefig'):
+        chart.savefig(path)
+    elif hasattr(chart, 'save'):
+        # altair.Chart and plotnine.ggplot
+        chart.save(str(path))
+    else:
+        from lets_plot import ggsave
+        ggsave(chart, path.name, path=str(path.parent))
+
+
+def render(name, backend='altair', fmt='html', force=False):
+    """
+    Path of `name` rendered with `backend` as `fmt`, rendering it only when
+    the cached file for the current data and spec is missing (or `force`).
+    """
+    entry = _figures[name]
+    renderer = entry['renderers'][backend]
+    data = entry['query']()
+    digest = _data_digest(data)
+    digest.update(f'{backend}:{fmt}:{_spec_source(renderer)}'.encode())
+    path = FIGURE_DIR / f'{name}.{backend}.{digest.hexdigest()[:12]}.{fmt}'
+    if force or not path.exists():
+        FIGURE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in FIGURE_DIR.glob(f'{name}.{backend}.*.{fmt}'):
+            stale.unlink()
+        chart = renderer(data)
+        _save(chart, path)
+        if hasattr(chart, 'savefig'):
+            import matplotlib.pyplot as plt
+            # Figure, or a seaborn grid holding one
+            plt.close(getattr(chart, 'figure', chart))
+    return path
+
+
+def render_all(backend='altair', fmt='html', force=False):
+    """Render every figure that has a `backend` renderer; returns {name: path}."""
+    return {name: render(name, backend, fmt, force) for name in figure_names(backend)}
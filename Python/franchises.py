@@ -0,0 +1,84 @@
+"""
+KBO franchise lineage.
+
+Teams were renamed over the years (OB -> 두산, 빙그레 -> 한화, 해태 -> KIA, ...).
+LINEAGE is a small dimension table with one row per team name: its franchise,
+an integer franchise_id and the seasons the name was used. `franchise_ids`
+maps a team column to franchise ids by integer code: the column is
+dictionary-encoded (a no-op for categoricals), the handful of categories are
+looked up once, and the per-row codes are translated with a NumPy take, so no
+string is compared per row. Grouping by franchise_id then uses integer keys.
+Given the season of each row, names used outside their seasons in LINEAGE
+(a data error) get no franchise.
+"""
+
+import numpy as np
+import pandas as pd
+
+# franchise -> [(team name, first season, last season)], as in chapter_4.R's
+# fct_collapse; names with alternative separators are listed separately
+FRANCHISES = {
+    '두산': [('OB', 1982, 1998), ('두산', 1999, None)],
+    '롯데': [('롯데', 1982, None)],
+    '삼성': [('삼성', 1982, None)],
+    'LG': [('MBC', 1982, 1989), ('LG', 1990, None)],
+    'KIA': [('해태', 1982, 2000), ('해태·KIA', 2001, 2001), ('해태/KIA', 2001, 2001),
+            ('KIA', 2001, None)],
+    '현대': [('삼미', 1982, 1984), ('삼미·청보', 1985, 1985), ('삼미/청보', 1985, 1985),
+           ('청보', 1985, 1987), ('태평양', 1988, 1995), ('현대', 1996, 2007)],
+    '한화': [('빙그레', 1986, 1993), ('한화', 1994, None)],
+    '쌍방울': [('쌍방울', 1991, 1999)],
+    'SK': [('SK', 2000, None)],
+    '키움': [('히어로즈', 2008, 2009), ('넥센', 2010, 2018), ('키움', 2019, None)],
+    'NC': [('NC', 2013, None)],
+    'KT': [('KT', 2015, None), ('kt', 2015, 2017)],
+}
+
+
+def _lineage():
+    rows = [
+        (team, franchise, franchise_id, first, last)
+        for franchise_id, (franchise, teams) in enumerate(FRANCHISES.items())
+        for team, first, last in teams
+    ]
+    lineage = pd.DataFrame(rows, columns=['team', 'franchise', 'franchise_id',
+                                          'first_year', 'last_year'])
+    lineage['franchise'] = pd.Categorical(lineage['franchise'], categories=list(FRANCHISES))
+    lineage['franchise_id'] = lineage['franchise_id'].astype(np.int16)
+    lineage['last_year'] = lineage['last_year'].astype('Int16')
+    return lineage
+
+
+LINEAGE = _lineage()
+FRANCHISE = pd.CategoricalDtype(list(FRANCHISES))
+
+
+def franchise_ids(teams, years=None):
+    """
+    int16 franchise_id per team name; names not in LINEAGE get -1, as do
+    names outside their first/last season when `years` is given.
+    """
+    teams = pd.Series(teams).astype('category')
+    lineage = LINEAGE.set_index('team').reindex(teams.cat.categories)
+    # one extra slot at the end, so missing names (code -1) take the "no franchise" entry
+    lookup = np.append(lineage['franchise_id'].fillna(-1).to_numpy(np.int16), np.int16(-1))
+    codes = teams.cat.codes.to_numpy()
+    ids = lookup[codes]
+    if years is not None:
+        first = np.append(lineage['first_year'].to_numpy(np.float64), np.nan)[codes]
+        last = np.append(lineage['last_year'].to_numpy(np.float64, na_value=np.inf), np.nan)[codes]
+        years = pd.Series(years).to_numpy(np.float64)
+        ids = np.where((years >= first) & (years <= last), ids, np.int16(-1))
+    return ids.astype(np.int16)
+
+
+def attach_franchise(frame, team='team', year=None):
+    """
+    `frame` with franchise_id and a categorical franchise column added,
+    checking each row's season in column `year` against LINEAGE if given.
+    """
+    ids = franchise_ids(frame[team], None if year is None else frame[year])
+    return frame.assign(
+        franchise_id=ids,
+        franchise=pd.Categorical.from_codes(ids, dtype=FRANCHISE),
+    )
@@ -0,0 +1,100 @@
+"""
+Vectorized Monty Hall simulation.
+
+Doors are numbered from 1. With the classic three doors the opened and the
+switched door follow from array arithmetic alone, because the door numbers
+always sum to 6. For `doors` > 3 with `opened` goat doors revealed, each trial
+gets a row of random keys and the doors are chosen with `argpartition`, which
+keeps everything in NumPy. Long runs are streamed in chunks so the running
+success rate of 1e8 trials needs only one chunk in memory at a time.
+"""
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 1_000_000
+
+
+def _play_three(rng, n_trials):
+    cars = rng.integers(1, 4, n_trials)
+    picks = rng.integers(1, 4, n_trials)
+    # When the pick is the car Monty opens one of the other two doors at random,
+    # otherwise the only door that is neither the car nor the pick.
+    offsets = rng.integers(1, 3, n_trials)
+    opens = np.where(cars == picks, (cars - 1 + offsets) % 3 + 1, 6 - cars - picks)
+    switched = 6 - picks - opens
+    return cars, picks, opens[:, None], switched
+
+
+def _play_many(rng, n_trials, doors, opened):
+    rows = np.arange(n_trials)
+    cars = rng.integers(1, doors + 1, n_trials)
+    picks = rng.integers(1, doors + 1, n_trials)
+
+    # Monty opens the `opened` goat doors with the smallest random keys
+    keys = rng.random((n_trials, doors))
+    keys[rows, cars - 1] = np.inf
+    keys[rows, picks - 1] = np.inf
+    opens = np.argpartition(keys, opened - 1, axis=1)[:, :opened]
+
+    # The player switches to a random door that is neither picked nor opened
+    keys = rng.random((n_trials, doors))
+    keys[rows, picks - 1] = np.inf
+    np.put_along_axis(keys, opens, np.inf, axis=1)
+    switched = keys.argmin(axis=1) + 1
+    return cars, picks, opens + 1, switched
+
+
+def play_monty_hall(n_trials, doors=3, opened=1, rng=None):
+    """
+    Play `n_trials` games and return (cars, initial_picks, monty_opens, switched_picks).
+
+    `monty_opens` has one column per opened door.
+    """
+    if not 1 <= opened <= doors - 2:
+        raise ValueError("opened must be between 1 and doors - 2")
+    rng = np.random.default_rng(rng)
+    if doors == 3:
+        return _play_three(rng, n_trials)
+    return _play_many(rng, n_trials, doors, opened)
+
+
+def simulate_monty_hall(n_trials, doors=3, opened=1, rng=None):
+    """Trial-level results with the running success rate of always switching."""
+    cars, picks, opens, switched = play_monty_hall(n_trials, doors, opened, rng)
+    results = pd.DataFrame({
+        'trial': np.arange(1, n_trials + 1),
+        'car': cars,
+        'initial_pick': picks,
+    })
+    if opened == 1:
+        results['monty_opens'] = opens[:, 0]
+    results['switched_pick'] = switched
+    results['result_if_switch'] = (cars == switched).astype(int)
+    results['success_rate'] = results['result_if_switch'].cumsum() / results['trial']
+    return results
+
+
+def stream_success_rate(n_trials, doors=3, opened=1, rng=None, chunk_size=CHUNK_SIZE, every=1):
+    """
+    Yield the running success rate of switching as DataFrames of one chunk each.
+
+    Only every `every`-th trial is kept, which keeps convergence plots of very
+    long runs small; the rate itself always counts all trials.
+    """
+    rng = np.random.default_rng(rng)
+    chunk_size = max(every, chunk_size - chunk_size % every)
+    wins = 0
+    for start in range(0, n_trials, chunk_size):
+        n = min(chunk_size, n_trials - start)
+        cars, _, _, switched = play_monty_hall(n, doors, opened, rng)
+        running = wins + np.cumsum(cars == switched)
+        wins = int(running[-1])
+        trials = np.arange(start + 1, start + n + 1)
+        keep = slice(every - 1, None, every)
+        yield pd.DataFrame({'trial': trials[keep], 'success_rate': running[keep] / trials[keep]})
+
+
+def switch_win_probability(doors=3, opened=1):
+    """Exact probability of winning by switching, (doors - 1) / (doors * (doors - opened - 1))."""
+    return (doors - 1) / (doors * (doors - opened - 1))
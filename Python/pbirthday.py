@@ -0,0 +1,73 @@
+"""
+Probability of coincident birthdays, a vectorized port of R's `pbirthday`.
+
+For the usual pair coincidence the whole curve for n = 0..N is computed
+exactly in one log-space cumulative sum:
+
+    log P(no shared birthday among n) = sum_{i < n} log(1 - i / classes)
+
+For three or more coincident birthdays R uses the Diaconis-Mosteller
+approximation, which is evaluated here over the whole array of n at once.
+Curves are memoized per (classes, coincident) and grown on demand, so repeated
+calls for the theoretical overlay are plain array lookups.
+"""
+
+import numpy as np
+from scipy.special import gammaln
+
+_curves = {}
+
+
+def _pair_curve(n_max, classes):
+    i = np.arange(n_max, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_terms = np.where(i < classes, np.log1p(-i / classes), -np.inf)
+    log_no_match = np.concatenate([[0.0], np.cumsum(log_terms)])
+    return 0.0 - np.expm1(log_no_match)
+
+
+def _coincident_curve(n_max, classes, coincident):
+    n = np.arange(n_max + 1, dtype=np.float64)
+    k = coincident
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lhs = n * np.exp(-n / (classes * k)) / (1 - n / (classes * (k + 1))) ** (1 / k)
+        lxx = k * np.log(lhs) - (k - 1) * np.log(classes) - gammaln(k + 1)
+        probs = -np.expm1(-np.exp(lxx))
+    probs = np.where(n < k, 0.0, probs)
+    return np.where(n > classes * (k - 1), 1.0, probs)
+
+
+def pbirthday_curve(n_max, classes=365, coincident=2):
+    """P(at least `coincident` people share a class) for n = 0..n_max, as an array."""
+    if coincident < 2:
+        return np.ones(n_max + 1)
+    key = (classes, coincident)
+    curve = _curves.get(key)
+    if curve is None or len(curve) <= n_max:
+        # Grow geometrically so a sequence of increasing requests stays cheap
+        size = max(n_max, 2 * (len(curve) - 1) if curve is not None else 0, 128)
+        if coincident == 2:
+            curve = _pair_curve(size, classes)
+        else:
+            curve = _coincident_curve(size, classes, coincident)
+        curve.setflags(write=False)
+        _curves[key] = curve
+    return curve[:n_max + 1]
+
+
+def pbirthday(n, classes=365, coincident=2):
+    """
+    Probability that at least `coincident` of `n` people share a birthday.
+
+    Mirrors R's pbirthday(n, classes, coincident). `n` may be a scalar or an
+    array of group sizes; an array returns an array of probabilities.
+    """
+    n_array = np.asarray(n, dtype=np.int64)
+    curve = pbirthday_curve(int(n_array.max(initial=0)), classes, coincident)
+    probs = curve[n_array]
+    return float(probs) if probs.ndim == 0 else probs
+
+
+def clear_cache():
+    """Drop all memoized curves."""
+    _curves.clear()
@@ -0,0 +1,77 @@
+"""
+Batched two-group permutation test for a difference in means.
+
+Each repetition is a row of a 0/1 label matrix obtained by shuffling the
+observed group labels, so the group sums for a whole chunk of repetitions come
+from one matrix multiply with the values. Repetitions are processed in chunks
+of at most `max_cells` labels, which keeps millions of repetitions in bounded
+memory.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+MAX_CELLS = 2**24
+
+PermutationResult = namedtuple('PermutationResult', ['stat', 'null', 'p_value'])
+
+
+def _split(values, labels, groups):
+    values = np.asarray(values, dtype=np.float64)
+    labels = np.asarray(labels)
+    if groups is None:
+        groups = tuple(dict.fromkeys(labels.tolist()))
+    if len(groups) != 2:
+        raise ValueError("a permutation test needs exactly two groups")
+    keep = (labels == groups[0]) | (labels == groups[1])
+    return values[keep], (labels[keep] == groups[0]).astype(np.float64)
+
+
+def permutation_null(values, labels, reps=1000, groups=None, rng=None, max_cells=MAX_CELLS):
+    """
+    Null distribution of mean(groups[0]) - mean(groups[1]) under shuffled labels.
+
+    `groups` defaults to the labels in order of first appearance. Rows whose
+    label is in neither group are ignored.
+    """
+    rng = np.random.default_rng(rng)
+    values, in_first = _split(values, labels, groups)
+    n_first = in_first.sum()
+    n_second = len(values) - n_first
+    total = values.sum()
+
+    null = np.empty(reps)
+    chunk = max(1, max_cells // max(len(values), 1))
+    for start in range(0, reps, chunk):
+        n_rows = min(chunk, reps - start)
+        shuffled = rng.permuted(np.broadcast_to(in_first, (n_rows, len(values))), axis=1)
+        first_sums = shuffled @ values
+        null[start:start + n_rows] = first_sums / n_first - (total - first_sums) / n_second
+    return null
+
+
+def p_value(null, stat, alternative='greater'):
+    """Share of the null distribution at least as extreme as `stat`."""
+    null = np.asarray(null)
+    if alternative == 'greater':
+        return (null >= stat).mean()
+    if alternative == 'less':
+        return (null <= stat).mean()
+    if alternative == 'two-sided':
+        return (np.abs(null) >= np.abs(stat)).mean()
+    raise ValueError("alternative must be 'greater', 'less' or 'two-sided'")
+
+
+def permutation_test(values, labels, reps=1000, groups=None, alternative='greater',
+                     rng=None, max_cells=MAX_CELLS):
+    """
+    Permutation test for mean(groups[0]) - mean(groups[1]).
+
+    Returns a PermutationResult with the observed statistic, the null
+    distribution and the p-value for `alternative`.
+    """
+    kept, in_first = _split(values, labels, groups)
+    stat = kept[in_first == 1].mean() - kept[in_first == 0].mean()
+    null = permutation_null(values, labels, reps, groups, rng, max_cells)
+    return PermutationResult(stat, null, p_value(null, stat, alternative))
@@ -0,0 +1,144 @@
+"""
+Pythagorean expectation with a fitted exponent.
+
+    win% = RS^x / (RS^x + RA^x)             pythagorean: x is fitted
+    x    = ((RS + RA) / G)^z                pythagenpat: z is fitted
+
+Writing L = ln(RS / RA), win% is the logistic function of x * L, which gives
+closed-form first and second derivatives. `fit_exponent` minimizes the squared
+error in wins (win% times decisions, 승 + 패, since KBO ties count for
+neither). It first scores a grid of candidate parameters against every
+team-season in one broadcasted (candidates x team-seasons) array, with
+per-group sums of squares taken as one matrix product against the group
+indicator, then refines each group's best candidate with a few Newton steps.
+`by` gives one parameter per group, e.g. per era:
+
+    fit_exponent(teams, by=teams['연도'] // 10 * 10)
+"""
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = {'runs': '득점', 'allowed': '실점', 'wins': '승', 'losses': '패', 'games': '경기'}
+
+GRIDS = {
+    'pythagorean': np.linspace(0.5, 4.0, 3501),
+    'pythagenpat': np.linspace(0.0, 1.0, 2001),
+}
+
+
+def _arrays(frame, columns):
+    columns = {**COLUMNS, **(columns or {})}
+    runs, allowed, wins, losses, games = (frame[columns[key]].to_numpy(dtype=np.float64)
+                                          for key in ('runs', 'allowed', 'wins', 'losses', 'games'))
+    return runs, allowed, wins, wins + losses, (runs + allowed) / games
+
+
+def _exponent(param, scoring, method):
+    if method == 'pythagorean':
+        return np.broadcast_to(param, np.broadcast_shapes(np.shape(param), scoring.shape))
+    if method == 'pythagenpat':
+        return scoring ** param
+    raise ValueError(f"method must be 'pythagorean' or 'pythagenpat', not {method!r}")
+
+
+def win_percent(runs, allowed, exponent=2.0):
+    """RS^x / (RS^x + RA^x), computed as a logistic of x * ln(RS / RA)."""
+    log_ratio = np.log(np.asarray(runs, dtype=np.float64) / np.asarray(allowed, dtype=np.float64))
+    return 1 / (1 + np.exp(-np.asarray(exponent) * log_ratio))
+
+
+def expected(frame, param=2.0, method='pythagorean', columns=None):
+    """
+    `frame` with the exponent, expected win% and expected wins added.
+
+    `param` is the exponent x (pythagorean) or z (pythagenpat), one value or
+    one per row.
+    """
+    runs, allowed, wins, decisions, scoring = _arrays(frame, columns)
+    exponent = _exponent(np.asarray(param, dtype=np.float64), scoring, method)
+    percent = win_percent(runs, allowed, exponent)
+    return frame.assign(exponent=exponent, expected_win_percent=percent,
+                        expected_wins=percent * decisions)
+
+
+def _derivatives(param, log_ratio, log_scoring, scoring, decisions, wins, method):
+    """Residuals in wins and the first/second derivatives of each squared residual."""
+    exponent = _exponent(param, scoring, method)
+    u = exponent * log_ratio
+    if method == 'pythagorean':
+        du, d2u = log_ratio, 0.0
+    else:
+        du = u * log_scoring
+        d2u = du * log_scoring
+    percent = 1 / (1 + np.exp(-u))
+    slope = percent * (1 - percent)
+    d_percent = slope * du
+    d2_percent = slope * (1 - 2 * percent) * du ** 2 + slope * d2u
+    residual = decisions * percent - wins
+    gradient = 2 * residual * decisions * d_percent
+    hessian = 2 * ((decisions * d_percent) ** 2 + residual * decisions * d2_percent)
+    return residual, gradient, hessian
+
+
+def fit_exponent(frame, method='pythagorean', by=None, grid=None, newton_steps=8,
+                 columns=None):
+    """
+    Least-squares exponent per group, with the RMSE of expected vs actual wins.
+
+    Returns one row per group (a single row when `by` is None) with the
+    group, `param` (x or z), the number of team-seasons `n` and `rmse` in
+    wins. `by` is a column name or an array aligned with `frame`; rows whose
+    group key is missing are left out of every fit.
+    """
+    if by is None:
+        labels = np.zeros(len(frame), dtype=np.int64)
+        groups = pd.Index(['all'], name='group')
+    else:
+        keys = frame[by] if isinstance(by, str) else pd.Series(np.asarray(by), index=frame.index)
+        present = keys.notna().to_numpy()
+        frame, keys = frame[present], keys[present]
+        labels, groups = pd.factorize(keys, sort=True)
+        groups = pd.Index(groups, name=by if isinstance(by, str) else getattr(by, 'name', 'group'))
+    runs, allowed, wins, decisions, scoring = _arrays(frame, columns)
+    n_groups = len(groups)
+    counts = np.bincount(labels, minlength=n_groups)
+    indicator = np.zeros((len(frame), n_groups))
+    indicator[np.arange(len(frame)), labels] = 1.0
+
+    # Grid search: candidates x team-seasons in one array, summed per group
+    candidates = GRIDS[method] if grid is None else np.asarray(grid, dtype=np.float64)
+    exponents = _exponent(candidates[:, None], scoring[None, :], method)
+    errors = decisions * win_percent(runs, allowed, exponents) - wins
+    sse = (errors ** 2) @ indicator
+    param = candidates[np.argmin(sse, axis=0)]
+
+    # Newton refinement of every group at once
+    log_ratio = np.log(runs / allowed)
+    log_scoring = np.log(scoring)
+    step_limit = np.ptp(candidates) / max(len(candidates) - 1, 1) * 10
+    for _ in range(newton_steps):
+        _, gradient, hessian = _derivatives(param[labels], log_ratio, log_scoring, scoring,
+                                            decisions, wins, method)
+        gradient = np.bincount(labels, weights=gradient, minlength=n_groups)
+        hessian = np.bincount(labels, weights=hessian, minlength=n_groups)
+        step = np.divide(gradient, hessian, out=np.zeros(n_groups), where=hessian > 0)
+        param = param - np.clip(step, -step_limit, step_limit)
+
+    residual, _, _ = _derivatives(param[labels], log_ratio, log_scoring, scoring,
+                                  decisions, wins, method)
+    rmse = np.sqrt(np.bincount(labels, weights=residual ** 2, minlength=n_groups) / counts)
+    return pd.DataFrame({'param': param, 'n': counts, 'rmse': rmse}, index=groups).reset_index()
+
+
+def compare(frame, by=None, columns=None):
+    """Fitted pythagorean and pythagenpat parameters side by side, plus x = 2 as a baseline."""
+    _, _, wins, decisions, _ = _arrays(frame, columns)
+    baseline = expected(frame, 2.0, columns=columns)['expected_win_percent'].to_numpy()
+    fits = [fit_exponent(frame, method, by=by, columns=columns).assign(method=method)
+            for method in GRIDS]
+    fixed = pd.DataFrame({'group': ['all'], 'param': [2.0], 'n': [len(frame)],
+                          'rmse': [np.sqrt(np.mean((baseline * decisions - wins) ** 2))],
+                          'method': ['pythagorean (x = 2)']})
+    return pd.concat([fixed.rename(columns={'group': fits[0].columns[0]}), *fits],
+                     ignore_index=True)
@@ -0,0 +1,53 @@
+"""
+As-of join of FIFA rankings onto match results.
+
+Each match gets the most recent ranking published on or before its date (and
+the rank before that) for both the team and the opponent. The rankings are
+sorted once and attached with `pd.merge_asof`, a sorted merge that stays linear
+in the number of rows, instead of equi-joining on the month and fixing the
+rank row by row.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def prepare_rankings(fifa_ranking):
+    """Rank history per country_abrv with the previous rank, sorted by rank_date."""
+    ranks = fifa_ranking[['country_abrv', 'rank_date', 'rank']].copy()
+    ranks['rank_date'] = pd.to_datetime(ranks['rank_date'])
+    ranks = (ranks.dropna(subset=['country_abrv'])
+             .drop_duplicates(subset=['country_abrv', 'rank_date'], keep='last')
+             .sort_values(['country_abrv', 'rank_date']))
+    ranks['previous_rank'] = ranks.groupby('country_abrv')['rank'].shift(1)
+    return ranks.sort_values('rank_date', kind='stable').reset_index(drop=True)
+
+
+def attach_ranks(results, rankings, date='date', sides=('team', 'opponent')):
+    """
+    Add <side>_rank, <side>_previous_rank and <side>_rank_date for every side.
+
+    `results` needs a `date` column and one `<side>_abrv` column per side;
+    `rankings` is the output of prepare_rankings. Matches played before a
+    country's first ranking get missing ranks. Row order is preserved.
+
+    Both date keys are cast to datetime64[ns] first, since merge_asof refuses
+    keys of different units (DuckDB's fetchdf returns microseconds).
+    """
+    matches = results.copy()
+    matches[date] = pd.to_datetime(matches[date]).astype('datetime64[ns]')
+    rankings = rankings.assign(rank_date=pd.to_datetime(rankings['rank_date'])
+                               .astype('datetime64[ns]'))
+    matches['_row'] = np.arange(len(matches))
+    matches = matches.sort_values(date, kind='stable')
+    for side in sides:
+        side_ranks = rankings.rename(columns={
+            'country_abrv': f'{side}_abrv',
+            'rank_date': f'{side}_rank_date',
+            'rank': f'{side}_rank',
+            'previous_rank': f'{side}_previous_rank',
+        })
+        matches = pd.merge_asof(matches, side_ranks,
+                                left_on=date, right_on=f'{side}_rank_date',
+                                by=f'{side}_abrv', direction='backward')
+    return matches.sort_values('_row').drop(columns='_row').reset_index(drop=True)
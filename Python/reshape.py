@@ -0,0 +1,42 @@
+"""
+Lazy tidying of wide stat sheets such as kbo_team_slash_untidy.xlsx.
+
+The sheet has one row per (팀, 구분) with one column per year, and 팀 is only
+filled on the first row of each team. `tidy_wide_sheet` builds a single lazy
+Polars plan over the cached Parquet copy: forward-fill the id column, unpivot
+the year columns and drop missing values. The plan is collected once, and only
+the final pivot of 구분 back to columns runs eagerly, since its output columns
+are the stat names found in the data.
+"""
+
+import polars as pl
+
+import datasets
+
+
+def tidy_wide_sheet(wide, fill='팀', key='구분', variable='연도', value='기록'):
+    """
+    DataFrame with one row per (fill, variable) and one column per `key` value.
+
+    `wide` is a Polars DataFrame or LazyFrame. Every column other than `fill`
+    and `key` is treated as a `variable` column. Stat columns follow their
+    order of first appearance in the unpivoted sheet.
+    """
+    wide = wide.lazy()
+    names = wide.collect_schema().names()
+    variables = [name for name in names if name not in (fill, key)]
+    long = (wide
+            .with_columns(pl.col(fill).forward_fill())
+            .unpivot(index=[fill, key], on=variables,
+                     variable_name=variable, value_name=value)
+            .drop_nulls([key, value])
+            .collect())
+    return (long.pivot(on=key, index=[fill, variable], values=value,
+                       aggregate_function='first')
+            .sort(fill, variable))
+
+
+def kbo_tidy():
+    """kbo_team_slash_untidy.xlsx as a tidy pandas DataFrame (팀, 연도, stats...)."""
+    wide = pl.scan_parquet(datasets.parquet_path('kbo_team_slash_untidy.xlsx'))
+    return tidy_wide_sheet(wide).to_pandas()
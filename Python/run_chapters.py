@@ -0,0 +1,222 @@
+"""
+Headless runner for the chapter scripts.
+
+Discovers the jupytext percent scripts (chapter_*.py), runs each one in its own
+worker process with the working directory set to the data folder, and times
+every `# %%` cell. Per cell it records the wall time and the peak traced
+allocation (tracemalloc, which covers NumPy buffers); per chapter it records
+the total time and the process's peak RSS. Tracing slows every allocation, so
+the times come from an untraced run and the peaks from a second, traced run
+(`--no-memory` skips it). Chapters run in parallel except where they share a
+store that is written in place (SHARED_STORES, see `dependencies`). The report
+is written as JSON (one entry per chapter) and CSV (one row per cell):
+
+    python run_chapters.py --jobs 4 --output reports
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import os
+import re
+import resource
+import sys
+import time
+import traceback
+import tracemalloc
+from pathlib import Path
+
+from pyprojroot.here import here
+
+SCRIPT_DIR = here('Python')
+DATA_DIR = here('R')
+
+# module -> store it writes in place; chapters importing the same module run
+# one at a time in chapter order. datasets' Parquet copies are not listed:
+# they are written under a temporary name and renamed, so readers never clash.
+SHARED_STORES = {
+    'soccer_pipeline': 'R/.parquet/soccer_models.duckdb',
+}
+
+CELL_MARKER = re.compile(r'^# %%(.*)$')
+IMPORT = re.compile(r'^\s*(?:from|import)\s+(\w+)', re.MULTILINE)
+
+
+def discover(script_dir=SCRIPT_DIR, names=None):
+    """Chapter scripts in `script_dir` in chapter order, optionally only `names`."""
+    def order(path):
+        return [int(part) if part.isdigit() else part
+                for part in re.split(r'(\d+)', path.stem)]
+
+    scripts = sorted(Path(script_dir).glob('chapter_*.py'), key=order)
+    if names:
+        scripts = [script for script in scripts if script.stem in names]
+    return scripts
+
+
+def dependencies(scripts):
+    """
+    chapter -> chapters that must finish first, derived from the stores each
+    chapter's imports write (SHARED_STORES). `scripts` is in chapter order, and
+    each chapter waits for the previous one using the same store.
+    """
+    depends, last_user = {}, {}
+    for script in scripts:
+        modules = set(IMPORT.findall(Path(script).read_text(encoding='utf-8')))
+        for store in sorted({SHARED_STORES[module] for module in modules & SHARED_STORES.keys()}):
+            if store in last_user:
+                depends.setdefault(script.stem, []).append(last_user[store])
+            last_user[store] = script.stem
+    return depends
+
+
+def split_cells(source):
+    """(first line, code) for each code cell of a percent script; markdown cells are skipped."""
+    cells = []
+    start, header, lines = 1, '', []
+    for number, line in enumerate(source.splitlines(), start=1):
+        match = CELL_MARKER.match(line)
+        if match:
+            if lines and '[markdown]' not in header:
+                cells.append((start, '\n'.join(lines)))
+            start, header, lines = number, match.group(1), []
+        else:
+            lines.append(line)
+    if lines and '[markdown]' not in header:
+        cells.append((start, '\n'.join(lines)))
+    return [(start, code) for start, code in cells if code.strip()]
+
+
+def _peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_chapter(script, data_dir=DATA_DIR, trace=False):
+    """
+    Execute one chapter cell by cell and return its record.
+
+    Untraced, each cell gets its wall time; with `trace` it gets its peak
+    traced allocation instead (`peak_bytes`), the timings being skewed by the
+    tracing itself.
+    """
+    script = Path(script)
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    os.chdir(data_dir)
+    sys.path.insert(0, str(script.parent))
+    namespace = {'__name__': '__main__', '__file__': str(script)}
+    record = {'chapter': script.stem, 'status': 'ok', 'cells': []}
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    for index, (line, code) in enumerate(split_cells(script.read_text(encoding='utf-8'))):
+        if trace:
+            tracemalloc.reset_peak()
+        cell_started = time.perf_counter()
+        error = None
+        try:
+            exec(compile(code, f'{script}:{line}', 'exec'), namespace)
+        except BaseException:
+            error = traceback.format_exc(limit=3)
+        cell = {'cell': index, 'line': line, 'error': error}
+        if trace:
+            cell['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        else:
+            cell['seconds'] = time.perf_counter() - cell_started
+        record['cells'].append(cell)
+        if error is not None:
+            record['status'] = 'error'
+            break
+    if trace:
+        tracemalloc.stop()
+    else:
+        record['seconds'] = time.perf_counter() - started
+        record['peak_rss_bytes'] = _peak_rss_bytes()
+    return record
+
+
+def _merge_peaks(records, traced):
+    """Copy each traced cell's peak_bytes onto the timed record of the same cell."""
+    for record, peaks in zip(records, traced):
+        by_cell = {cell['cell']: cell['peak_bytes'] for cell in peaks['cells']}
+        for cell in record['cells']:
+            cell['peak_bytes'] = by_cell.get(cell['cell'])
+    return records
+
+
+def run_all(scripts, jobs=None, data_dir=DATA_DIR, memory=True):
+    """
+    Run `scripts` in a process pool, honouring `dependencies`; returns records
+    in input order. With `memory`, a second, traced pass adds each cell's
+    peak_bytes.
+    """
+    records = _run_pass(scripts, jobs, data_dir, trace=False)
+    if memory:
+        records = _merge_peaks(records, _run_pass(scripts, jobs, data_dir, trace=True))
+    return records
+
+
+def _run_pass(scripts, jobs, data_dir, trace):
+    depends = dependencies(scripts)
+    pending = {script.stem: script for script in scripts}
+    records = {}
+    # a fresh process per chapter keeps peak RSS and imported state per chapter
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as pool:
+        running = {}
+        while pending or running:
+            for name in list(pending):
+                if all(dep in records or dep not in pending and dep not in running
+                       for dep in depends.get(name, [])):
+                    running[pool.submit(run_chapter, pending.pop(name), data_dir, trace)] = name
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    records[name] = future.result()
+                except Exception:
+                    records[name] = {'chapter': name, 'status': 'crashed', 'cells': [],
+                                     'error': traceback.format_exc(limit=3)}
+    return [records[script.stem] for script in scripts]
+
+
+def write_report(records, output):
+    """Write timings.json and cells.csv into the `output` directory."""
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    (output / 'timings.json').write_text(
+        json.dumps(records, indent=2, ensure_ascii=False), encoding='utf-8')
+    with open(output / 'cells.csv', 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['chapter', 'cell', 'line', 'seconds', 'peak_bytes', 'error'])
+        for record in records:
+            for cell in record['cells']:
+                # last traceback line only, e.g. "KeyError: 'team'"
+                error = (cell['error'] or '').strip().splitlines()
+                writer.writerow([record['chapter'], cell['cell'], cell['line'],
+                                 f"{cell['seconds']:.6f}", cell.get('peak_bytes', ''),
+                                 error[-1] if error else ''])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the chapter scripts headlessly and time them.')
+    parser.add_argument('chapters', nargs='*', help='chapter names to run (default: all)')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes')
+    parser.add_argument('--data-dir', default=str(DATA_DIR), help='working directory for chapters')
+    parser.add_argument('--output', default=str(SCRIPT_DIR / 'reports'), help='report directory')
+    parser.add_argument('--memory', action=argparse.BooleanOptionalAction, default=True,
+                        help='add per-cell peak allocations from a second, traced run')
+    args = parser.parse_args()
+
+    scripts = discover(names=args.chapters)
+    records = run_all(scripts, jobs=args.jobs, data_dir=args.data_dir, memory=args.memory)
+    write_report(records, args.output)
+    for record in records:
+        print(f"{record['chapter']:<20} {record['status']:<8} {record.get('seconds', 0):8.2f}s")
+    return 0 if all(record['status'] == 'ok' for record in records) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
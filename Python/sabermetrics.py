@@ -0,0 +1,79 @@
+"""
+Batting rate stats from counting columns, defined once.
+
+    tb  = h + 2b + 2 * 3b + 3 * hr
+    avg = h / ab
+    obp = (h + bb + hbp) / (ab + bb + hbp + sf)
+    slg = tb / ab
+    ops = obp + slg
+
+`rate_stats` computes the requested stats for a pandas DataFrame in one pass
+over the underlying NumPy arrays and adds them with a single `assign`, so
+there is no intermediate frame per stat. `rate_stat_exprs` returns the same
+definitions as Polars expressions for `with_columns`/`select`, lazy or eager.
+Rates with a zero denominator are NaN (null in Polars).
+"""
+
+import numpy as np
+import polars as pl
+
+STATS = ('tb', 'avg', 'obp', 'slg', 'ops')
+
+# Counting columns each stat reads
+REQUIRED = {
+    'tb': ('h', '2b', '3b', 'hr'),
+    'avg': ('h', 'ab'),
+    'obp': ('h', 'bb', 'hbp', 'ab', 'sf'),
+    'slg': ('h', '2b', '3b', 'hr', 'ab'),
+    'ops': ('h', '2b', '3b', 'hr', 'bb', 'hbp', 'ab', 'sf'),
+}
+
+
+def _ratio(numerator, denominator):
+    out = np.full(numerator.shape, np.nan)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+
+def rate_stats(frame, stats=STATS):
+    """
+    Return `frame` with the requested rate stats added as columns.
+
+    Only the counting columns the stats need are read, so a table with just
+    `h` and `ab` can ask for stats=['avg'].
+    """
+    needed = sorted({column for stat in stats for column in REQUIRED[stat]})
+    counts = {column: frame[column].to_numpy(dtype=np.float64) for column in needed}
+    values = {}
+    if {'tb', 'slg', 'ops'} & set(stats):
+        values['tb'] = counts['h'] + counts['2b'] + 2 * counts['3b'] + 3 * counts['hr']
+    if 'avg' in stats:
+        values['avg'] = _ratio(counts['h'], counts['ab'])
+    if {'obp', 'ops'} & set(stats):
+        on_base = counts['h'] + counts['bb'] + counts['hbp']
+        values['obp'] = _ratio(on_base, counts['ab'] + counts['bb'] + counts['hbp'] + counts['sf'])
+    if {'slg', 'ops'} & set(stats):
+        values['slg'] = _ratio(values['tb'], counts['ab'])
+    if 'ops' in stats:
+        values['ops'] = values['obp'] + values['slg']
+    return frame.assign(**{stat: values[stat] for stat in stats})
+
+
+def _ratio_expr(numerator, denominator):
+    return pl.when(denominator != 0).then(numerator / denominator)
+
+
+def rate_stat_exprs(stats=STATS):
+    """Polars expressions for the requested rate stats, aliased to their names."""
+    h, ab, bb, hbp, sf = (pl.col(name).cast(pl.Float64)
+                          for name in ('h', 'ab', 'bb', 'hbp', 'sf'))
+    tb = (pl.col('h') + pl.col('2b') + 2 * pl.col('3b') + 3 * pl.col('hr')).cast(pl.Float64)
+    obp = _ratio_expr(h + bb + hbp, ab + bb + hbp + sf)
+    slg = _ratio_expr(tb, ab)
+    expressions = {
+        'tb': tb,
+        'avg': _ratio_expr(h, ab),
+        'obp': obp,
+        'slg': slg,
+        'ops': obp + slg,
+    }
+    return [expressions[stat].alias(stat) for stat in stats]
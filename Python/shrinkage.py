@@ -0,0 +1,143 @@
+"""
+Empirical-Bayes batting averages with a Beta prior.
+
+The prior is fitted to the averages of players with enough plate appearances
+(chapter 18 uses tpa >= 250) and every player-season is then updated
+conjugately:
+
+    posterior = Beta(alpha + h, beta + ab - h)
+
+`fit_beta_prior` uses the method of moments, or the maximum likelihood
+estimate refined from it by Newton's method on the Beta log-likelihood
+(digamma/trigamma of two sufficient statistics), instead of a generic
+optimizer. With `by` (e.g. 'year') both run for all groups at once on
+bincount sums. Years with too few qualified players fall back to the
+overall prior. `shrink` adds the posterior mean and an equal-tailed credible
+interval for every row with one `betaincinv` call over arrays.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import betaincinv, digamma, polygamma
+
+EPSILON = 1e-6
+
+
+def _moments(mean, variance):
+    common = mean * (1 - mean) / variance - 1
+    return mean * common, (1 - mean) * common
+
+
+def _grouped_fit(avg, labels, n_groups, method, newton_steps):
+    """(alpha, beta) arrays of length n_groups for averages labelled by group."""
+    avg = np.clip(avg, EPSILON, 1 - EPSILON)
+    counts = np.bincount(labels, minlength=n_groups).astype(np.float64)
+    mean = np.bincount(labels, weights=avg, minlength=n_groups) / counts
+    variance = (np.bincount(labels, weights=(avg - mean[labels]) ** 2, minlength=n_groups)
+                / (counts - 1))
+    alpha, beta = _moments(mean, variance)
+    if method == 'moments':
+        return alpha, beta
+    if method != 'mle':
+        raise ValueError(f"method must be 'moments' or 'mle', not {method!r}")
+
+    log_x = np.bincount(labels, weights=np.log(avg), minlength=n_groups) / counts
+    log_1mx = np.bincount(labels, weights=np.log1p(-avg), minlength=n_groups) / counts
+    for _ in range(newton_steps):
+        total = digamma(alpha + beta)
+        grad_a = total - digamma(alpha) + log_x
+        grad_b = total - digamma(beta) + log_1mx
+        cross = polygamma(1, alpha + beta)
+        h_aa = cross - polygamma(1, alpha)
+        h_bb = cross - polygamma(1, beta)
+        det = h_aa * h_bb - cross ** 2
+        step_a = (h_bb * grad_a - cross * grad_b) / det
+        step_b = (h_aa * grad_b - cross * grad_a) / det
+        # halve steps that would leave the positive quadrant
+        scale = np.ones_like(alpha)
+        for _ in range(50):
+            bad = (alpha - scale * step_a <= 0) | (beta - scale * step_b <= 0)
+            if not bad.any():
+                break
+            scale[bad] /= 2
+        alpha = alpha - scale * step_a
+        beta = beta - scale * step_b
+    return alpha, beta
+
+
+def fit_beta_prior(avg, method='mle', newton_steps=20):
+    """(alpha, beta) of a Beta distribution fitted to the averages `avg`."""
+    avg = np.asarray(avg, dtype=np.float64)
+    avg = avg[~np.isnan(avg)]
+    alpha, beta = _grouped_fit(avg, np.zeros(len(avg), dtype=np.int64), 1,
+                               method, newton_steps)
+    return float(alpha[0]), float(beta[0])
+
+
+def fit_priors(frame, by, min_tpa=250, min_players=20, method='mle', newton_steps=20):
+    """
+    Beta prior per value of `by`, fitted on players with tpa >= `min_tpa`.
+
+    Groups with fewer than `min_players` qualified players get the prior
+    fitted on all qualified players. Returns one row per group with
+    prior_alpha, prior_beta, players and pooled (True where the overall prior
+    was used).
+    """
+    qualified = frame[(frame['tpa'] >= min_tpa) & (frame['ab'] > 0)]
+    avg = (qualified['h'] / qualified['ab']).to_numpy(dtype=np.float64)
+    overall = fit_beta_prior(avg, method, newton_steps)
+
+    groups = pd.Index(np.sort(frame[by].dropna().unique()), name=by)
+    labels = groups.get_indexer(qualified[by])
+    avg, labels = avg[labels >= 0], labels[labels >= 0]
+    players = np.bincount(labels, minlength=len(groups))
+    enough = players >= max(min_players, 2)
+    fitted = np.flatnonzero(enough)
+    keep = enough[labels]
+    alpha = np.full(len(groups), overall[0])
+    beta = np.full(len(groups), overall[1])
+    if len(fitted):
+        alpha[fitted], beta[fitted] = _grouped_fit(
+            avg[keep], np.searchsorted(fitted, labels[keep]), len(fitted), method, newton_steps)
+    return pd.DataFrame({
+        'prior_alpha': alpha,
+        'prior_beta': beta,
+        'players': players,
+        'pooled': ~enough,
+    }, index=groups).reset_index()
+
+
+def posterior(h, ab, alpha, beta, level=0.95):
+    """Posterior mean and equal-tailed `level` interval for hits `h` in `ab` at-bats."""
+    h = np.asarray(h, dtype=np.float64)
+    post_alpha = np.asarray(alpha + h)
+    post_beta = np.asarray(beta + np.asarray(ab, dtype=np.float64) - h)
+    tail = (1 - level) / 2
+    bounds = betaincinv(post_alpha[..., None], post_beta[..., None], np.array([tail, 1 - tail]))
+    return post_alpha / (post_alpha + post_beta), bounds[..., 0], bounds[..., 1]
+
+
+def shrink(frame, by=None, min_tpa=250, min_players=20, level=0.95, method='mle'):
+    """
+    `frame` with avg and its empirical-Bayes estimate for every row.
+
+    Adds avg (h / ab), prior_alpha/prior_beta, eb_avg (posterior mean) and
+    eb_low/eb_high (the `level` credible interval). With `by`, each group gets
+    its own prior (see fit_priors); otherwise one prior is fitted to all
+    players with tpa >= `min_tpa`.
+    """
+    h = frame['h'].to_numpy(dtype=np.float64)
+    ab = frame['ab'].to_numpy(dtype=np.float64)
+    if by is None:
+        qualified = frame[(frame['tpa'] >= min_tpa) & (frame['ab'] > 0)]
+        alpha, beta = fit_beta_prior(qualified['h'] / qualified['ab'], method)
+        alpha = np.full(len(frame), alpha)
+        beta = np.full(len(frame), beta)
+    else:
+        priors = fit_priors(frame, by, min_tpa, min_players, method).set_index(by)
+        alpha = priors['prior_alpha'].reindex(frame[by]).to_numpy()
+        beta = priors['prior_beta'].reindex(frame[by]).to_numpy()
+    mean, low, high = posterior(h, ab, alpha, beta, level)
+    avg = np.divide(h, ab, out=np.full(len(h), np.nan), where=ab > 0)
+    return frame.assign(avg=avg, prior_alpha=alpha, prior_beta=beta,
+                        eb_avg=mean, eb_low=low, eb_high=high)
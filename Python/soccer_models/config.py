@@ -0,0 +1,36 @@
+"""
+SQLMesh project for the soccer results pipeline of chapters 6 and 7.
+
+The models run on a DuckDB file next to the Parquet copies in R/.parquet and
+read those copies (see macros/data_files.py). soccer.matches and
+soccer.match_sides are INCREMENTAL_BY_TIME_RANGE on the match date, so a run
+only processes dates that have no interval yet. The rankings and the country
+codes are small FULL models rebuilt every run, and everything that joins the
+codes is downstream of the incremental models (a view and a FULL model), so a
+corrected code reaches every match. Python/ is put on sys.path so the models
+and macros can reuse countries.py and datasets.py.
+"""
+
+import sys
+
+from pyprojroot.here import here
+from sqlmesh.core.config import (
+    Config,
+    DuckDBConnectionConfig,
+    GatewayConfig,
+    ModelDefaultsConfig,
+)
+
+sys.path.insert(0, str(here('Python')))
+
+# not soccer.duckdb: the catalog would share its name with the soccer schema
+DATABASE = here('R') / '.parquet' / 'soccer_models.duckdb'
+
+config = Config(
+    gateways={
+        'duckdb': GatewayConfig(connection=DuckDBConnectionConfig(database=str(DATABASE))),
+    },
+    default_gateway='duckdb',
+    # chapter 6 keeps matches after 1993-08-08, the first FIFA ranking month
+    model_defaults=ModelDefaultsConfig(dialect='duckdb', start='1993-08-09', cron='@daily'),
+)
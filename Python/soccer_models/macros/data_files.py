@@ -0,0 +1,17 @@
+from sqlglot import exp
+from sqlmesh import macro
+
+
+@macro()
+def data_file(evaluator, name):
+    """
+    Path of the Parquet copy of a data file in R/, e.g. @data_file('fifa_ranking.csv').
+
+    The copy has the schema declared in datasets.SCHEMAS and is decoded with
+    the file's encoding, so DuckDB never parses the raw CSV.
+    """
+    # imported here: module-level objects of a macro file must be serializable
+    import datasets
+
+    file_name = name.this if isinstance(name, exp.Literal) else str(name)
+    return exp.Literal.string(str(datasets.parquet_path(file_name)))
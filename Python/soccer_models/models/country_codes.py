@@ -0,0 +1,31 @@
+import typing as t
+from datetime import datetime
+
+import pandas as pd
+from sqlmesh import ExecutionContext, model
+
+from countries import country_codes
+
+
+@model(
+    'soccer.country_codes',
+    kind='FULL',
+    columns={'team': 'text', 'country_abrv': 'text'},
+    depends_on=['soccer.matches', 'soccer.fifa_ranking'],
+    description='FIFA country code per results team name, resolved with countries.py',
+)
+def execute(
+    context: ExecutionContext,
+    start: datetime,
+    end: datetime,
+    execution_time: datetime,
+    **kwargs: t.Any,
+) -> pd.DataFrame:
+    matches = context.resolve_table('soccer.matches')
+    ranking = context.resolve_table('soccer.fifa_ranking')
+    names = context.fetchdf(
+        f'SELECT home_team AS team FROM {matches} UNION SELECT away_team FROM {matches}'
+    )['team']
+    fifa_ranking = context.fetchdf(f'SELECT DISTINCT country_full, country_abrv FROM {ranking}')
+    # FULL rebuilds reuse the countries.py cache, so only new names are matched
+    return country_codes(names, fifa_ranking)
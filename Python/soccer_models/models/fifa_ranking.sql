@@ -0,0 +1,27 @@
+MODEL (
+  name soccer.fifa_ranking,
+  kind FULL,
+  grain (country_abrv, rank_date),
+  description 'Rank history per country with the previous rank, as in rankings.prepare_rankings'
+);
+
+WITH ranks AS (
+  SELECT
+    id,
+    country_full::TEXT AS country_full,
+    country_abrv::TEXT AS country_abrv,
+    rank::INTEGER AS rank,
+    rank_date::DATE AS rank_date
+  FROM read_parquet(@data_file('fifa_ranking.csv'))
+  WHERE
+    country_abrv IS NOT NULL
+  QUALIFY
+    row_number() OVER (PARTITION BY country_abrv, rank_date ORDER BY id DESC) = 1
+)
+SELECT
+  country_full,
+  country_abrv,
+  rank_date,
+  rank,
+  lag(rank) OVER (PARTITION BY country_abrv ORDER BY rank_date) AS previous_rank
+FROM ranks
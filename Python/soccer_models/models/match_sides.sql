@@ -0,0 +1,46 @@
+MODEL (
+  name soccer.match_sides,
+  kind INCREMENTAL_BY_TIME_RANGE (
+    time_column date
+  ),
+  grain (date, team, opponent),
+  description 'One row per match and side, with win/draw/lose flags, as in team_perspective.py'
+);
+
+WITH matches AS (
+  SELECT
+    *
+  FROM soccer.matches
+  WHERE
+    date BETWEEN @start_date AND @end_date
+), sides AS (
+  SELECT
+    date,
+    home_team AS team,
+    away_team AS opponent,
+    home_score AS team_score,
+    away_score AS opponent_score,
+    tournament,
+    city,
+    country,
+    neutral
+  FROM matches
+  UNION ALL
+  SELECT
+    date,
+    away_team,
+    home_team,
+    away_score,
+    home_score,
+    tournament,
+    city,
+    country,
+    neutral
+  FROM matches
+)
+SELECT
+  *,
+  (team_score > opponent_score)::TINYINT AS win,
+  (team_score = opponent_score)::TINYINT AS draw,
+  (team_score < opponent_score)::TINYINT AS lose
+FROM sides
@@ -0,0 +1,25 @@
+MODEL (
+  name soccer.matches,
+  kind INCREMENTAL_BY_TIME_RANGE (
+    time_column date
+  ),
+  grain (date, home_team, away_team),
+  description 'Played international matches from the results file, one row per match'
+);
+
+SELECT
+  date::DATE AS date,
+  trim(home_team)::TEXT AS home_team,
+  trim(away_team)::TEXT AS away_team,
+  home_score::INTEGER AS home_score,
+  away_score::INTEGER AS away_score,
+  tournament::TEXT AS tournament,
+  city::TEXT AS city,
+  country::TEXT AS country,
+  neutral::BOOLEAN AS neutral
+FROM read_parquet(@data_file('international_soccer_matches_results.csv'))
+WHERE
+  date::DATE BETWEEN @start_date AND @end_date
+  /* fixtures without a result yet */
+  AND home_score IS NOT NULL
+  AND away_score IS NOT NULL
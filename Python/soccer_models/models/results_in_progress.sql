@@ -0,0 +1,19 @@
+MODEL (
+  name soccer.results_in_progress,
+  kind VIEW,
+  grain (date, team, opponent),
+  description 'Match sides with both FIFA codes; replaces soccer_matches_results_in_progress.csv'
+);
+
+/* A view, not an incremental model: the codes are a FULL model, and a
+   corrected code has to reach matches whose interval was already processed */
+SELECT
+  sides.*,
+  team_codes.country_abrv AS team_abrv,
+  opponent_codes.country_abrv AS opponent_abrv
+FROM soccer.match_sides AS sides
+/* inner joins drop names without a FIFA code, like dropna in chapter 6 */
+JOIN soccer.country_codes AS team_codes
+  ON team_codes.team = sides.team AND team_codes.country_abrv IS NOT NULL
+JOIN soccer.country_codes AS opponent_codes
+  ON opponent_codes.team = sides.opponent AND opponent_codes.country_abrv IS NOT NULL
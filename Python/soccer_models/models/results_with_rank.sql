@@ -0,0 +1,28 @@
+MODEL (
+  name soccer.results_with_rank,
+  /* FULL like its inputs' codes and ranks, which can change for past matches */
+  kind FULL,
+  grain (date, team, opponent),
+  description 'Matches with the latest FIFA rank on or before the match date for both sides, as in rankings.attach_ranks'
+);
+
+SELECT
+  results.date,
+  results.team,
+  results.opponent,
+  results.team_score,
+  results.opponent_score,
+  results.tournament,
+  team_ranks.rank AS team_rank,
+  team_ranks.previous_rank AS team_previous_rank,
+  team_ranks.rank_date AS team_rank_date,
+  opponent_ranks.rank AS opponent_rank,
+  opponent_ranks.previous_rank AS opponent_previous_rank,
+  opponent_ranks.rank_date AS opponent_rank_date,
+  results.win
+FROM soccer.results_in_progress AS results
+ASOF LEFT JOIN soccer.fifa_ranking AS team_ranks
+  ON team_ranks.country_abrv = results.team_abrv AND results.date >= team_ranks.rank_date
+ASOF LEFT JOIN soccer.fifa_ranking AS opponent_ranks
+  ON opponent_ranks.country_abrv = results.opponent_abrv
+  AND results.date >= opponent_ranks.rank_date
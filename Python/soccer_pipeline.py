@@ -0,0 +1,51 @@
+"""
+Entry points for the SQLMesh soccer project in soccer_models/.
+
+`run()` applies the project to the prod environment (backfilling on the first
+call) and then runs the models, so only match dates without a processed
+interval are read and split into sides. The tables are read back with
+`results_in_progress()` and `results_with_rank()`, which take the place of the
+soccer_matches_results_in_progress.csv that chapter 6 used to write for
+chapter 7, and `country_codes()`, the name -> FIFA code mapping they use.
+"""
+
+import functools
+
+from pyprojroot.here import here
+from sqlmesh import Context
+
+PROJECT_DIR = here('Python') / 'soccer_models'
+
+
+@functools.lru_cache(maxsize=1)
+def context():
+    """The SQLMesh context of the soccer project."""
+    return Context(paths=str(PROJECT_DIR))
+
+
+def run():
+    """Apply model changes and process any new date intervals."""
+    ctx = context()
+    ctx.plan('prod', auto_apply=True, no_prompts=True)
+    ctx.run('prod')
+
+
+def _table(name, refresh, order='date, team, opponent'):
+    if refresh:
+        run()
+    return context().fetchdf(f'SELECT * FROM {name} ORDER BY {order}')
+
+
+def country_codes(refresh=True):
+    """team -> country_abrv for every results team name; unresolved names have no code."""
+    return _table('soccer.country_codes', refresh, order='team')
+
+
+def results_in_progress(refresh=True):
+    """One row per match and side with team_abrv/opponent_abrv, as a pandas DataFrame."""
+    return _table('soccer.results_in_progress', refresh)
+
+
+def results_with_rank(refresh=True):
+    """results_in_progress with the as-of FIFA ranks of both sides."""
+    return _table('soccer.results_with_rank', refresh)
@@ -0,0 +1,77 @@
+"""
+Compact schema for Statcast pitch-level data.
+
+Default inference reads a Statcast export as int64/float64 plus object strings,
+including a run of deprecated columns that are always empty. DTYPES declares
+the smallest type that holds each column: nullable Int8/Int16/Int32 for counts
+and ids, Float32 for measurements and categoricals for the repeated labels
+(pitch_type, pitch_name, events, description, teams, ...). The DEPRECATED
+columns are never read. `read_options` gives the pd.read_csv arguments for
+this schema; datasets uses them for 2020_ryu.csv, whose Parquet copy keeps the
+compact types for the chapters.
+"""
+
+# Always empty in current exports
+DEPRECATED = [
+    'spin_dir', 'spin_rate_deprecated', 'break_angle_deprecated',
+    'break_length_deprecated', 'tfs_deprecated', 'tfs_zulu_deprecated',
+    'umpire', 'sv_id',
+]
+
+CATEGORIES = [
+    'pitch_type', 'player_name', 'events', 'description', 'game_type', 'stand',
+    'p_throws', 'home_team', 'away_team', 'type', 'bb_type', 'inning_topbot',
+    'pitch_name', 'if_fielding_alignment', 'of_fielding_alignment',
+]
+
+INT8 = [
+    'zone', 'hit_location', 'balls', 'strikes', 'outs_when_up', 'inning',
+    'woba_denom', 'babip_value', 'iso_value', 'launch_speed_angle', 'pitch_number',
+    'home_score', 'away_score', 'bat_score', 'fld_score', 'post_away_score',
+    'post_home_score', 'post_bat_score', 'post_fld_score',
+]
+
+INT16 = [
+    'game_year', 'hit_distance_sc', 'launch_angle', 'release_spin_rate',
+    'at_bat_number',
+]
+
+# Player and game ids
+INT32 = [
+    'batter', 'pitcher', 'on_3b', 'on_2b', 'on_1b', 'game_pk',
+    'fielder_2', 'fielder_3', 'fielder_4', 'fielder_5', 'fielder_6',
+    'fielder_7', 'fielder_8', 'fielder_9',
+]
+
+FLOAT32 = [
+    'release_speed', 'release_pos_x', 'release_pos_z', 'release_pos_y',
+    'pfx_x', 'pfx_z', 'plate_x', 'plate_z', 'hc_x', 'hc_y',
+    'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az', 'sz_top', 'sz_bot',
+    'launch_speed', 'effective_speed', 'release_extension',
+    'estimated_ba_using_speedangle', 'estimated_woba_using_speedangle',
+    'woba_value',
+]
+
+NA_VALUES = ['null']
+
+DTYPES = {
+    **{column: 'category' for column in CATEGORIES},
+    **{column: 'Int8' for column in INT8},
+    **{column: 'Int16' for column in INT16},
+    **{column: 'Int32' for column in INT32},
+    **{column: 'Float32' for column in FLOAT32},
+}
+
+
+def _keep(column):
+    return column not in DEPRECATED
+
+
+def read_options(columns=None):
+    """pd.read_csv keyword arguments for the Statcast schema."""
+    if columns is None:
+        usecols = _keep
+    else:
+        usecols = [column for column in columns if _keep(column)]
+    return {'usecols': usecols, 'dtype': DTYPES, 'na_values': NA_VALUES}
+
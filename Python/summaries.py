@@ -0,0 +1,123 @@
+"""
+Chart-ready summaries computed in Polars before an Altair chart is built.
+
+Altair inlines a chart's data into the spec as JSON, and Vega-Lite transforms
+(`bin`, `count()`, `transform_density`, `mark_boxplot`) then run over every
+row in the browser. These helpers compute the same summaries up front, so a
+chart carries one row per bin, category or grid point and its spec size and
+render time scale with the bins, not with the rows.
+
+- `histogram`: bin_start, bin_end, count (for `bin='binned'` encodings)
+- `value_counts`: one row per category with its count
+- `density`: Gaussian KDE on a grid, optionally per group
+- `box_stats`: quartiles and 1.5 IQR whiskers per group, plus `box_outliers`
+"""
+
+import numpy as np
+import polars as pl
+from scipy.signal import fftconvolve
+
+from density import gaussian_kernel, scott_bandwidth
+
+
+def _as_polars(frame):
+    return frame if isinstance(frame, pl.DataFrame) else pl.from_pandas(frame)
+
+
+def _groupby_list(groupby):
+    if groupby is None:
+        return []
+    return [groupby] if isinstance(groupby, str) else list(groupby)
+
+
+def histogram(frame, column, bins=30, step=None):
+    """
+    Counts per bin of `column`: equal-width `bins` over the data range, or
+    bins of width `step` aligned to multiples of `step`.
+    """
+    values = _as_polars(frame).select(pl.col(column).cast(pl.Float64)).drop_nulls()
+    low, high = values.select(pl.col(column).min().alias('low'),
+                              pl.col(column).max().alias('high')).row(0)
+    if step is not None:
+        start = np.floor(low / step) * step
+        n_bins = max(int(np.ceil((high - start) / step)), 1)
+    else:
+        start = low
+        n_bins = bins
+        step = (high - low) / bins if high > low else 1.0
+    index = ((pl.col(column) - start) / step).floor().clip(0, n_bins - 1).cast(pl.Int64)
+    counts = values.group_by(index.alias('bin')).agg(count=pl.len())
+    return (pl.DataFrame({'bin': np.arange(n_bins, dtype=np.int64)})
+            .join(counts, on='bin', how='left')
+            .with_columns(pl.col('count').fill_null(0),
+                          bin_start=start + pl.col('bin') * step,
+                          bin_end=start + (pl.col('bin') + 1) * step)
+            .select('bin_start', 'bin_end', 'count'))
+
+
+def value_counts(frame, column, sort=True):
+    """Rows per value of `column`, most frequent first when `sort` is true."""
+    counts = _as_polars(frame).group_by(column).agg(count=pl.len())
+    return counts.sort('count', descending=True) if sort else counts.sort(column)
+
+
+def _kde(values, grid, bandwidth):
+    """Binned Gaussian KDE of `values` evaluated on an evenly spaced `grid`."""
+    step = grid[1] - grid[0]
+    edges = np.append(grid - step / 2, grid[-1] + step / 2)
+    counts, _ = np.histogram(values, bins=edges)
+    if bandwidth is None:
+        bandwidth = scott_bandwidth(values, dims=1)
+    kernel = gaussian_kernel(bandwidth, step)
+    smoothed = np.clip(fftconvolve(counts.astype(np.float64), kernel, mode='same'), 0, None)
+    return smoothed / (len(values) * step) if len(values) else smoothed
+
+
+def density(frame, column, groupby=None, points=200, bandwidth=None):
+    """
+    KDE of `column` on `points` grid values spanning the data, per group.
+
+    Like Vega-Lite's transform_density, the grid spans the extent of the
+    whole column, so groups share x values. `bandwidth` defaults to Scott's
+    rule per group.
+    """
+    groupby = _groupby_list(groupby)
+    data = _as_polars(frame).select(*groupby, pl.col(column).cast(pl.Float64)).drop_nulls()
+    low, high = data.select(pl.col(column).min().alias('low'),
+                            pl.col(column).max().alias('high')).row(0)
+    grid = np.linspace(low, high, points)
+    parts = []
+    for keys, group in (data.group_by(groupby, maintain_order=True) if groupby else [((), data)]):
+        part = pl.DataFrame({column: grid,
+                             'density': _kde(group[column].to_numpy(), grid, bandwidth)})
+        parts.append(part.with_columns(pl.lit(key).alias(name) for name, key in zip(groupby, keys)))
+    return pl.concat(parts).select(*groupby, column, 'density')
+
+
+def box_stats(frame, value, groupby):
+    """Quartiles and the 1.5 IQR whisker ends per group, as used by mark_boxplot."""
+    groupby = _groupby_list(groupby)
+    data = _as_polars(frame).select(*groupby, value).drop_nulls(value)
+    column = pl.col(value)
+    quartiles = data.group_by(groupby, maintain_order=True).agg(
+        q1=column.quantile(0.25, interpolation='linear'),
+        median=column.median(),
+        q3=column.quantile(0.75, interpolation='linear'),
+    )
+    iqr = pl.col('q3') - pl.col('q1')
+    fences = quartiles.select(*groupby, low=pl.col('q1') - 1.5 * iqr,
+                              high=pl.col('q3') + 1.5 * iqr)
+    whiskers = (data.join(fences, on=groupby)
+                .filter(column.is_between(pl.col('low'), pl.col('high')))
+                .group_by(groupby).agg(lower=column.min(), upper=column.max()))
+    return quartiles.join(whiskers, on=groupby, how='left', maintain_order='left')
+
+
+def box_outliers(frame, value, groupby, stats=None):
+    """Rows of `frame` (groupby and value only) outside the whiskers of `box_stats`."""
+    groupby = _groupby_list(groupby)
+    stats = box_stats(frame, value, groupby) if stats is None else stats
+    return (_as_polars(frame).select(*groupby, value)
+            .join(stats, on=groupby)
+            .filter((pl.col(value) < pl.col('lower')) | (pl.col(value) > pl.col('upper')))
+            .select(*groupby, value))
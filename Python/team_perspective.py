@@ -0,0 +1,75 @@
+"""
+Team-perspective view of match results.
+
+Every match appears twice in the long format, once from each side, with
+team/opponent and team_score/opponent_score swapped. `team_perspective` builds
+that table as a Polars LazyFrame over the original rows, with the team names
+dictionary-encoded as Categorical, so nothing is copied until `.collect()`.
+`team_records` computes wins, draws, losses and win% per team straight from
+the match rows, one aggregation per side, without building the long table.
+"""
+
+import pandas as pd
+import polars as pl
+
+SIDES = {
+    'home': ('home_team', 'away_team', 'home_score', 'away_score'),
+    'away': ('away_team', 'home_team', 'away_score', 'home_score'),
+}
+
+
+def _lazy(results):
+    if isinstance(results, pd.DataFrame):
+        results = pl.from_pandas(results)
+    if isinstance(results, pl.DataFrame):
+        results = results.lazy()
+    return results.with_columns(
+        pl.col('home_team', 'away_team').cast(pl.Categorical),
+    )
+
+
+def team_perspective(results):
+    """
+    LazyFrame with one row per match and side, plus win/draw/lose flags.
+
+    `results` may be a pandas or Polars DataFrame or a LazyFrame with the
+    international-results columns. The other columns are carried through.
+    """
+    matches = _lazy(results)
+    renamed = {'home_team', 'away_team', 'home_score', 'away_score'}
+    rest = [name for name in matches.collect_schema().names() if name not in renamed]
+    sides = [
+        matches.select(
+            *rest,
+            team=pl.col(team),
+            opponent=pl.col(opponent),
+            team_score=pl.col(team_score),
+            opponent_score=pl.col(opponent_score),
+        )
+        for team, opponent, team_score, opponent_score in SIDES.values()
+    ]
+    return pl.concat(sides).with_columns(
+        win=(pl.col('team_score') > pl.col('opponent_score')).cast(pl.Int8),
+        draw=(pl.col('team_score') == pl.col('opponent_score')).cast(pl.Int8),
+        lose=(pl.col('team_score') < pl.col('opponent_score')).cast(pl.Int8),
+    )
+
+
+def team_records(results):
+    """Wins, draws, loses, matches and win_percent per team, as a pandas DataFrame."""
+    matches = _lazy(results)
+    per_side = [
+        matches.group_by(pl.col(team).alias('team')).agg(
+            wins=(pl.col(team_score) > pl.col(opponent_score)).sum(),
+            draws=(pl.col(team_score) == pl.col(opponent_score)).sum(),
+            loses=(pl.col(team_score) < pl.col(opponent_score)).sum(),
+        )
+        for team, _, team_score, opponent_score in SIDES.values()
+    ]
+    records = (pl.concat(per_side)
+               .group_by('team')
+               .agg(pl.col('wins', 'draws', 'loses').sum())
+               .with_columns(matches=pl.col('wins') + pl.col('draws') + pl.col('loses'))
+               .with_columns(win_percent=pl.col('wins') / pl.col('matches'))
+               .sort('team'))
+    return records.collect().to_pandas()
@@ -0,0 +1,55 @@
+"""
+Season-over-season window metrics.
+
+`season_windows` adds, for every metric column at once, the previous and next
+season's value, the change from the previous season and a trailing rolling
+mean, each computed within a partition (league, gender, team, ...) ordered by
+season. All columns are built as Polars `over()` window expressions in a single
+`with_columns`, so the whole year-over-year delta table for the ~100 numeric
+kovo_team columns is one query rather than one groupby-shift per metric.
+"""
+
+import pandas as pd
+import polars as pl
+
+# window -> column suffix
+SUFFIXES = {
+    'lag': '_전_시즌',
+    'lead': '_다음_시즌',
+    'diff': '_차이',
+    'rolling': '_이동평균',
+}
+
+
+def _window_exprs(metric, partition, order, rolling):
+    column = pl.col(metric)
+    over = {'partition_by': partition, 'order_by': order}
+    return [
+        column.shift(1).over(**over).alias(metric + SUFFIXES['lag']),
+        column.shift(-1).over(**over).alias(metric + SUFFIXES['lead']),
+        column.diff().over(**over).alias(metric + SUFFIXES['diff']),
+        column.rolling_mean(rolling, min_samples=1).over(**over)
+        .alias(metric + SUFFIXES['rolling']),
+    ]
+
+
+def season_windows(frame, partition, order='시즌', metrics=None, rolling=3):
+    """
+    `frame` with lag, lead, diff and rolling-mean columns for each metric.
+
+    `partition` is a column or list of columns, `order` the season column.
+    `metrics` defaults to every numeric column outside the partition and
+    order. The rolling mean covers the current and `rolling - 1` previous
+    seasons. Row order is preserved; a pandas frame returns a pandas frame.
+    """
+    partition = [partition] if isinstance(partition, str) else list(partition)
+    is_pandas = isinstance(frame, pd.DataFrame)
+    table = pl.from_pandas(frame) if is_pandas else frame
+    if metrics is None:
+        schema = table.collect_schema()
+        metrics = [name for name, dtype in schema.items()
+                   if dtype.is_numeric() and name not in partition and name != order]
+    exprs = [expr for metric in metrics
+             for expr in _window_exprs(metric, partition, order, rolling)]
+    table = table.with_columns(exprs)
+    return table.to_pandas() if is_pandas else table
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The modules under test are flat scripts in Python/, imported the way the chapters import them
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Python'))
@@ -0,0 +1,41 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import pytest
+
+import book_figures  # noqa: F401  (registers the figures)
+import figures
+
+BACKENDS = [('altair', 'html'), ('matplotlib', 'png'), ('plotnine', 'png')]
+
+
+@pytest.fixture(autouse=True)
+def figure_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(figures, 'FIGURE_DIR', tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize('backend, fmt', BACKENDS)
+def test_every_figure_renders(backend, fmt):
+    names = figures.figure_names(backend)
+    assert names
+    paths = figures.render_all(backend, fmt)
+    assert sorted(paths) == sorted(names)
+    for path in paths.values():
+        assert path.exists() and path.stat().st_size > 0
+
+
+def test_render_reuses_cached_file():
+    name = figures.figure_names('matplotlib')[0]
+    first = figures.render(name, 'matplotlib', 'png')
+    written = first.stat().st_mtime_ns
+    assert figures.render(name, 'matplotlib', 'png') == first
+    assert first.stat().st_mtime_ns == written
+
+
+def test_chart_draws_without_saving(figure_dir):
+    for backend, _ in BACKENDS:
+        for name in figures.figure_names(backend):
+            assert figures.chart(name, backend) is not None
+    assert not any(figure_dir.iterdir())
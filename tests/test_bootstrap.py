@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from bootstrap import confidence_intervals
+
+
+def test_bca_falls_back_to_percentile_when_replicates_are_one_sided():
+    data = np.array([1.0, 2.0, 3.0, 4.0])
+    replicates = np.linspace(3.0, 4.0, 200)  # all above the estimate 2.5
+    with pytest.warns(RuntimeWarning, match='percentile'):
+        ci = confidence_intervals(data, replicates).set_index('method')
+    assert np.isfinite(ci.loc['bca', ['lower', 'upper']].to_numpy(dtype=float)).all()
+    assert ci.loc['bca', 'lower'] == ci.loc['percentile', 'lower']
+    assert ci.loc['bca', 'upper'] == ci.loc['percentile', 'upper']
@@ -0,0 +1,16 @@
+import numpy as np
+from scipy.stats import ttest_ind
+
+import datasets
+
+
+def test_chapter_11_period_t_statistic_is_finite():
+    # The BC vs AC comparison of chapters 11 and 12, home matches without 리그1
+    matches = datasets.uefa_big_5_19_20()
+    home = matches[(matches['장소'] == '안방') & (matches['리그'] != '리그1')]
+    rates = home.groupby(['팀', '시기'])['승리'].mean().reset_index()
+    assert not rates['승리'].isna().any()
+    t_stat, p_value = ttest_ind(rates.loc[rates['시기'] == 'AC', '승리'],
+                                rates.loc[rates['시기'] == 'BC', '승리'],
+                                equal_var=False, alternative='less')
+    assert np.isfinite(t_stat) and np.isfinite(p_value)
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rankings import attach_ranks, prepare_rankings
+
+
+def _fifa_ranking():
+    return pd.DataFrame({
+        'country_abrv': ['KOR', 'KOR', 'JPN', 'JPN'],
+        'rank_date': ['2020-01-01', '2020-06-01', '2020-01-01', '2020-06-01'],
+        'rank': [40, 38, 28, 27],
+    })
+
+
+def test_attach_ranks_accepts_microsecond_match_dates():
+    # soccer_pipeline reads its tables with DuckDB's fetchdf, which returns datetime64[us]
+    results = pd.DataFrame({
+        'date': pd.to_datetime(['2020-07-01', '2020-03-01']).astype('datetime64[us]'),
+        'team_abrv': ['KOR', 'JPN'],
+        'opponent_abrv': ['JPN', 'KOR'],
+    })
+    ranked = attach_ranks(results, prepare_rankings(_fifa_ranking()))
+    assert ranked['team_rank'].tolist() == [38, 28]
+    assert ranked['opponent_rank'].tolist() == [27, 40]
+    assert ranked['team_previous_rank'].tolist()[0] == 40
+    assert np.isnan(ranked['team_previous_rank'].tolist()[1])
+
+
+def test_chapter_7_load_path():
+    pytest.importorskip('sqlmesh')
+    import datasets
+    import soccer_pipeline
+
+    results_in_progress = soccer_pipeline.results_in_progress()
+    ranked = attach_ranks(results_in_progress, prepare_rankings(datasets.fifa_ranking()))
+    assert len(ranked) == len(results_in_progress)
+    assert ranked['team_rank'].notna().any()
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from summaries import density, histogram
+
+FRAME = pd.DataFrame({
+    'group': ['a', 'a', 'a', 'b', 'b', 'b'],
+    'value': [0.25, 0.28, 0.31, 0.22, 0.30, 0.35],
+})
+
+
+@pytest.mark.parametrize('frame', [FRAME, pl.from_pandas(FRAME)])
+def test_histogram_counts_every_row(frame):
+    bins = histogram(frame, 'value', bins=4)
+    assert bins.columns == ['bin_start', 'bin_end', 'count']
+    assert bins.height == 4
+    assert bins['count'].sum() == len(FRAME)
+    assert bins['bin_start'][0] == pytest.approx(0.22)
+    assert bins['bin_end'][-1] == pytest.approx(0.35)
+
+
+def test_histogram_with_step_aligns_bins():
+    bins = histogram(FRAME, 'value', step=0.05)
+    assert bins['bin_start'][0] == pytest.approx(0.20)
+    assert bins['count'].sum() == len(FRAME)
+
+
+@pytest.mark.parametrize('groupby', [None, 'group'])
+def test_density_has_one_curve_per_group(groupby):
+    curves = density(FRAME, 'value', groupby=groupby, points=50)
+    groups = curves.partition_by(groupby) if groupby else [curves]
+    assert len(groups) == (2 if groupby else 1)
+    for curve in groups:
+        assert curve.height == 50
+        values = curve['density'].to_numpy()
+        assert np.isfinite(values).all()
+        assert (values >= 0).all() and values.max() > 0